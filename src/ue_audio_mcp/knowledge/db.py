@@ -11,6 +11,8 @@ import json
 import logging
 import os
 import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -227,6 +229,16 @@ CREATE INDEX IF NOT EXISTS idx_bat_target ON bp_audio_triggers(target_asset);
 """
 
 
+# Relaxed settings for bulk_load(): no fsync, in-memory temp tables, ~64 MB cache.
+# journal_mode is left alone so an exception or a killed process still rolls
+# back; with synchronous=OFF only an OS crash or power loss can corrupt the file.
+_BULK_LOAD_PRAGMAS = (
+    ("synchronous", "OFF"),
+    ("temp_store", "MEMORY"),
+    ("cache_size", "-65536"),
+)
+
+
 def _escape_like(value: str) -> str:
     """Escape LIKE wildcard characters (%, _) in user input."""
     return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -255,6 +267,11 @@ class KnowledgeDB:
             Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(db_path)
         self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            # WAL: commits append to the log and only fsync at checkpoints
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._tx_depth = 0
         self._conn.executescript(_SCHEMA)
         self._migrate_v2()
 
@@ -294,6 +311,90 @@ class KnowledgeDB:
 
         self._conn.commit()
 
+    def _commit(self) -> None:
+        """Commit now, unless a transaction() block will commit on exit."""
+        if not self._tx_depth:
+            self._conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group writes into one transaction (commit on exit, rollback on error).
+
+        Per-insert commits are deferred while the block is open, so bulk
+        loads pay for a single journal sync.  Nested blocks join the outer one.
+        """
+        self._tx_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._tx_depth -= 1
+            if not self._tx_depth:
+                self._conn.rollback()
+            raise
+        self._tx_depth -= 1
+        if not self._tx_depth:
+            self._conn.commit()
+
+    @contextmanager
+    def bulk_load(self, defer_indexes: Iterable[str] = ()) -> Iterator[None]:
+        """transaction() with durability relaxed for a trusted one-shot load.
+
+        Applies _BULK_LOAD_PRAGMAS for the duration and restores the previous
+        values afterwards.  An exception rolls the load back, but with
+        synchronous=OFF an OS crash or power loss mid-load may corrupt the
+        file; delete it and reseed.
+
+        ``defer_indexes`` names the tables about to be loaded.  Those that are
+        still empty have their secondary indexes dropped for the load and
+        rebuilt once at the end; populated tables keep theirs.
+        """
+        if self._tx_depth or self._conn.in_transaction:
+            # Safety level can't change mid-transaction; join the open one.
+            with self.transaction():
+                yield
+            return
+        saved = [
+            (name, self._conn.execute(f"PRAGMA {name}").fetchone()[0])
+            for name, _ in _BULK_LOAD_PRAGMAS
+        ]
+        for name, value in _BULK_LOAD_PRAGMAS:
+            self._conn.execute(f"PRAGMA {name}={value}")
+        try:
+            with self.transaction():
+                index_sql = self._drop_secondary_indexes(defer_indexes)
+                yield
+                for sql in index_sql:
+                    self._conn.execute(sql)
+        finally:
+            for name, value in saved:
+                self._conn.execute(f"PRAGMA {name}={value}")
+
+    def _drop_secondary_indexes(self, tables: Iterable[str]) -> list[str]:
+        """Drop indexes on the empty tables among ``tables``; return their CREATEs."""
+        tables = list(tables)
+        if not tables:
+            return []
+        rows = self._conn.execute(
+            "SELECT name, tbl_name, sql FROM sqlite_master "
+            "WHERE type = 'index' AND sql IS NOT NULL "
+            "AND tbl_name IN ({})".format(", ".join("?" * len(tables))),
+            tables,
+        ).fetchall()
+        # Names come from sqlite_master, so quoting them into SQL is safe
+        empty = {
+            tbl for tbl in {row["tbl_name"] for row in rows}
+            if self._conn.execute(
+                'SELECT 1 FROM "{}" LIMIT 1'.format(tbl)
+            ).fetchone() is None
+        }
+        defs = [row for row in rows if row["tbl_name"] in empty]
+        if defs and not self._conn.in_transaction:
+            # DDL doesn't open a transaction implicitly; keep the drops undoable
+            self._conn.execute("BEGIN")
+        for row in defs:
+            self._conn.execute('DROP INDEX "{}"'.format(row["name"]))
+        return [row["sql"] for row in defs]
+
     def _parse_json_fields(self, d: dict) -> dict:
         for key, val in d.items():
             if isinstance(val, str) and val and val[0] in ("{", "["):
@@ -332,7 +433,19 @@ class KnowledgeDB:
                 node.get("mcp_note", ""),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_nodes_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert node rows in insert_node() column order, JSON pre-encoded."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO metasound_nodes "
+            "(name, category, description, inputs, outputs, tags, complexity, "
+            "class_name, variant_group, source, mcp_note) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     def query_nodes(
         self,
@@ -390,7 +503,18 @@ class KnowledgeDB:
                 json.dumps(func.get("returns", {})),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_waapi_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (uri, namespace, operation, description, params, returns)."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO waapi_functions "
+            "(uri, namespace, operation, description, params, returns) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     def query_waapi(
         self,
@@ -433,7 +557,18 @@ class KnowledgeDB:
                 json.dumps(wtype.get("properties", [])),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_wwise_types_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (type_name, category, description, properties) tuples."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO wwise_types "
+            "(type_name, category, description, properties) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     # -- Audio patterns ----------------------------------------------------
 
@@ -451,7 +586,18 @@ class KnowledgeDB:
                 json.dumps(pattern.get("key_nodes", [])),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_patterns_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (name, pattern_type, description, graph_spec, complexity, key_nodes)."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO audio_patterns "
+            "(name, pattern_type, description, graph_spec, complexity, key_nodes) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     def query_patterns(self, pattern_type: str | None = None) -> list[dict]:
         if pattern_type:
@@ -492,7 +638,7 @@ class KnowledgeDB:
                 "VALUES (?, ?, ?, ?)",
                 (signature, template, fix, json.dumps(params or {})),
             )
-        self._conn.commit()
+        self._commit()
 
     def query_errors(self, signature: str) -> list[dict]:
         return self._fetch(
@@ -517,7 +663,18 @@ class KnowledgeDB:
                 json.dumps(example.get("details", {})),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_examples_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (name, game, system_type, description, details) tuples."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO ue_game_examples "
+            "(name, game, system_type, description, details) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     # -- Blueprint audio ---------------------------------------------------
 
@@ -536,7 +693,18 @@ class KnowledgeDB:
                 json.dumps(bp.get("tags", [])),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_blueprint_audio_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (name, class_name, category, description, params, returns, tags)."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO blueprint_audio "
+            "(name, class_name, category, description, params, returns, tags) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     # -- Blueprint core ----------------------------------------------------
 
@@ -555,7 +723,7 @@ class KnowledgeDB:
                 json.dumps(bp.get("tags", [])),
             ),
         )
-        self._conn.commit()
+        self._commit()
 
     # -- Blueprint curated (audio + core) -----------------------------------
 
@@ -609,7 +777,7 @@ class KnowledgeDB:
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
             self._blueprint_scraped_params(bp),
         )
-        self._conn.commit()
+        self._commit()
 
     def insert_blueprint_scraped_batch(self, nodes: list[dict]) -> None:
         """Insert many scraped nodes in a single transaction (fast for 1K+ rows)."""
@@ -619,7 +787,7 @@ class KnowledgeDB:
             "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
             [self._blueprint_scraped_params(bp) for bp in nodes],
         )
-        self._conn.commit()
+        self._commit()
 
     @staticmethod
     def _blueprint_scraped_params(bp: dict) -> tuple:
@@ -690,7 +858,17 @@ class KnowledgeDB:
                 json.dumps(func.get("params", [])),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_builder_api_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (name, category, description, params) tuples."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO builder_api_functions "
+            "(name, category, description, params) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     def query_builder_api(self, category: str | None = None) -> list[dict]:
         if category:
@@ -721,7 +899,18 @@ class KnowledgeDB:
                 wf.get("metasound_template", ""),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_tutorial_workflows_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert workflow rows in insert_tutorial_workflow() column order."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO tutorial_workflows "
+            "(name, tutorial, url, layers, description, tags, bp_template, ms_template) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     def query_tutorial_workflows(self, tag: str | None = None) -> list[dict]:
         if tag:
@@ -750,7 +939,18 @@ class KnowledgeDB:
                 cmd.get("description", ""),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_console_commands_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (cmd, category, type, default_val, description) tuples."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO audio_console_commands "
+            "(cmd, category, type, default_val, description) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     # -- Spatialization ----------------------------------------------------
 
@@ -764,7 +964,17 @@ class KnowledgeDB:
                 json.dumps(method.get("details", {})),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_spatialization_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (name, description, details) tuples."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO spatialization_methods "
+            "(name, description, details) VALUES (?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     # -- Attenuation -------------------------------------------------------
 
@@ -779,7 +989,17 @@ class KnowledgeDB:
                 json.dumps(sub.get("details", {})),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_attenuation_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert (name, description, params, details) tuples."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO attenuation_subsystems "
+            "(name, description, params, details) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     # -- Project audio assets (from uasset extraction) ----------------------
 
@@ -803,7 +1023,18 @@ class KnowledgeDB:
                 source or asset.get("source", ""),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_project_assets_batch(self, rows: Iterable[tuple]) -> int:
+        """Bulk-insert asset rows in insert_project_asset() column order."""
+        cur = self._conn.executemany(
+            "INSERT OR REPLACE INTO project_audio_assets "
+            "(name, project, asset_type, path, refs, properties, details, source) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._commit()
+        return cur.rowcount
 
     def insert_project_blueprint(self, bp: dict, project: str, source: str = "") -> None:
         self._conn.execute(
@@ -823,7 +1054,7 @@ class KnowledgeDB:
                 source or bp.get("source", ""),
             ),
         )
-        self._conn.commit()
+        self._commit()
 
     def import_uasset_entries(self, entries: list[dict], project: str) -> int:
         """Bulk-import entries from uasset extraction. Returns count."""
@@ -834,7 +1065,7 @@ class KnowledgeDB:
             else:
                 self.insert_project_asset(entry, project)
             count += 1
-        self._conn.commit()
+        self._commit()
         return count
 
     def query_project_assets(
@@ -901,10 +1132,16 @@ class KnowledgeDB:
                 m.get("description", ""),
             ),
         )
-        self._conn.commit()
+        self._commit()
+
+    def insert_pin_mappings_batch(self, mappings: list[dict], replace: bool = False) -> int:
+        """Bulk-insert pin mappings. Returns count inserted.
 
-    def insert_pin_mappings_batch(self, mappings: list[dict]) -> int:
-        """Bulk-insert pin mappings. Returns count inserted."""
+        Rows have no natural key, so ``replace=True`` clears the table first
+        to make re-seeding idempotent.
+        """
+        if replace:
+            self._conn.execute("DELETE FROM pin_mappings")
         self._conn.executemany(
             "INSERT INTO pin_mappings "
             "(bp_function, bp_pin, ms_node, ms_pin, data_type, direction, description) "
@@ -919,7 +1156,7 @@ class KnowledgeDB:
                 for m in mappings
             ],
         )
-        self._conn.commit()
+        self._commit()
         return len(mappings)
 
     def query_pin_mappings(
@@ -966,16 +1203,24 @@ class KnowledgeDB:
             "(alias, canonical, alias_type) VALUES (?, ?, ?)",
             (alias, canonical, alias_type),
         )
-        self._conn.commit()
+        self._commit()
 
-    def insert_node_aliases_batch(self, aliases: list[tuple[str, str, str]]) -> int:
-        """Bulk-insert (alias, canonical, alias_type) tuples."""
+    def insert_node_aliases_batch(
+        self, aliases: list[tuple[str, str, str]], replace: bool = False,
+    ) -> int:
+        """Bulk-insert (alias, canonical, alias_type) tuples.
+
+        ``replace=True`` clears the table first so aliases the catalogue no
+        longer produces do not survive a re-seed.
+        """
+        if replace:
+            self._conn.execute("DELETE FROM node_aliases")
         self._conn.executemany(
             "INSERT OR REPLACE INTO node_aliases "
             "(alias, canonical, alias_type) VALUES (?, ?, ?)",
             aliases,
         )
-        self._conn.commit()
+        self._commit()
         return len(aliases)
 
     def resolve_node_alias(self, name: str) -> str | None:
@@ -1006,7 +1251,7 @@ class KnowledgeDB:
             "VALUES (?, ?, ?, ?, ?)",
             (graph_name, project, node_class, node_display, usage_count),
         )
-        self._conn.commit()
+        self._commit()
 
     def insert_graph_node_usage_batch(
         self, rows: list[tuple[str, str, str, str, int]]
@@ -1018,7 +1263,7 @@ class KnowledgeDB:
             "VALUES (?, ?, ?, ?, ?)",
             rows,
         )
-        self._conn.commit()
+        self._commit()
         return len(rows)
 
     def query_graph_node_usage(
@@ -1075,7 +1320,7 @@ class KnowledgeDB:
             (bp_name, project, trigger_type, function_name,
              target_asset, json.dumps(details or {})),
         )
-        self._conn.commit()
+        self._commit()
 
     def insert_bp_audio_triggers_batch(self, rows: list[dict]) -> int:
         """Bulk-insert bp_audio_triggers dicts."""
@@ -1090,7 +1335,7 @@ class KnowledgeDB:
                 for r in rows
             ],
         )
-        self._conn.commit()
+        self._commit()
         return len(rows)
 
     def query_bp_audio_triggers(
@@ -1187,10 +1432,11 @@ class KnowledgeDB:
         }
 
     def is_seeded(self) -> bool:
+        # Existence probe: stops at the first row instead of counting them all
         row = self._conn.execute(
-            "SELECT COUNT(*) as cnt FROM metasound_nodes"
+            "SELECT 1 FROM metasound_nodes LIMIT 1"
         ).fetchone()
-        return row["cnt"] > 0
+        return row is not None
 
     def close(self) -> None:
         self._conn.close()
@@ -13,6 +13,8 @@ and Epic's MetaSounds Function Nodes Reference Guide.
 
 from __future__ import annotations
 
+import re
+
 from ue_audio_mcp.knowledge.node_schema import MSPin, MSNode
 
 
@@ -2742,7 +2744,10 @@ def get_nodes_by_category(category: str) -> list[NodeDef]:
 def get_nodes_by_tag(tag: str) -> list[NodeDef]:
     """Return all nodes whose tags list contains the given tag (case-insensitive)."""
     tag_lower = tag.lower()
-    return [n for n in METASOUND_NODES.values() if tag_lower in (t.lower() for t in n["tags"])]
+    return [
+        n for n in METASOUND_NODES.values()
+        if any(t.lower() == tag_lower for t in n["tags"])
+    ]
 
 
 def search_nodes(query: str) -> list[NodeDef]:
@@ -2757,19 +2762,15 @@ def search_nodes(query: str) -> list[NodeDef]:
     name_hits: list[NodeDef] = []
     tag_hits: list[NodeDef] = []
     desc_hits: list[NodeDef] = []
-    seen: set[str] = set()
 
+    # Branches are exclusive, so each node lands in at most one bucket.
     for node in METASOUND_NODES.values():
-        nid = node["name"]
         if q in node["name"].lower():
             name_hits.append(node)
-            seen.add(nid)
         elif any(q in t.lower() for t in node["tags"]):
             tag_hits.append(node)
-            seen.add(nid)
         elif q in node["description"].lower():
-            if nid not in seen:
-                desc_hits.append(node)
+            desc_hits.append(node)
     return name_hits + tag_hits + desc_hits
 
 
@@ -3037,6 +3038,50 @@ for _name, _node_def in METASOUND_NODES.items():
 del _name, _node_def
 
 
+# Variant-group patterns for _infer_variant_group, compiled once
+_VARIANT_RE_TYPE_N = re.compile(r'^(.+?)\s*\(([^,]+),\s*\d+\)$')  # "Name (Type, N)"
+_VARIANT_RE_N = re.compile(r'^(.+?)\s*\(\d+\)$')                 # "Name (N)"
+_VARIANT_RE_TYPE = re.compile(r'^(.+?)\s*\([^)]+\)$')             # "Name (Type)"
+
+
+def _infer_variant_group(name: str) -> str:
+    """Infer variant group from node name.
+
+    'Audio Mixer (Stereo, 3)' -> 'Audio Mixer (Stereo)'
+    'Trigger Any (4)'         -> 'Trigger Any'
+    'Clamp (Float)'           -> 'Clamp'
+    'Sine'                    -> ''  (no variant)
+    """
+    if "(" not in name:
+        return ""
+    # Common case: a single trailing "(...)" group -- plain string ops,
+    # same results as the regexes below.
+    if name.endswith(")") and name.count("(") == 1 and name.count(")") == 1:
+        head, _, inner = name[:-1].partition("(")
+        base = head.rstrip()
+        if base and inner:
+            type_, comma, count = inner.partition(",")
+            count = count.lstrip()
+            if comma and type_ and count.isdecimal():
+                return f"{base} ({type_.strip()})"
+            return base.strip()
+    # Pattern: "Name (Type, N)" -> "Name (Type)"
+    m = _VARIANT_RE_TYPE_N.match(name)
+    if m:
+        return f"{m.group(1)} ({m.group(2).strip()})"
+    # Pattern: "Name (N)" where N is a digit -> "Name"
+    m = _VARIANT_RE_N.match(name)
+    if m:
+        return m.group(1).strip()
+    # Pattern: "Name (Type)" -> "Name"  (e.g. Clamp (Float) -> Clamp)
+    m = _VARIANT_RE_TYPE.match(name)
+    if m:
+        base = m.group(1).strip()
+        # Only group if there are other variants with same base
+        return base
+    return ""
+
+
 def class_name_to_display(class_name: str) -> str | None:
     """Convert a UE class_name like 'UE::Sine::Audio' to display name 'Sine'.
 
@@ -29,6 +29,8 @@ class MSNode(TypedDict):
     tags: NotRequired[list[str]]
     complexity: NotRequired[int]
     class_name: NotRequired[str]
+    variant_group: NotRequired[str]  # inferred from the name when seeding
+    source: NotRequired[str]  # "catalogue" for hand-curated entries
     mcp_note: NotRequired[str]
 
 
@@ -8,259 +8,353 @@ and populates the node_aliases table.
 
 from __future__ import annotations
 
+import json
 import logging
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING
 
+from ue_audio_mcp.knowledge.blueprint_audio import BLUEPRINT_AUDIO_FUNCTIONS
+from ue_audio_mcp.knowledge.blueprint_scraped import load_scraped_nodes
+from ue_audio_mcp.knowledge.bp_ms_pin_mappings import PIN_MAPPINGS
+from ue_audio_mcp.knowledge.metasound_nodes import (
+    CLASS_NAME_TO_DISPLAY,
+    DISPLAY_TO_CLASS,
+    METASOUND_NODES,
+    _infer_variant_group,
+)
+from ue_audio_mcp.knowledge.tutorials import (
+    ATTENUATION_SUBSYSTEMS,
+    AUDIO_CONSOLE_COMMANDS,
+    BUILDER_API_FUNCTIONS,
+    SPATIALIZATION_METHODS,
+    TUTORIAL_WORKFLOWS,
+)
+from ue_audio_mcp.knowledge.waapi_functions import WAAPI_FUNCTIONS
+from ue_audio_mcp.knowledge.wwise_types import (
+    COMMON_PROPERTIES,
+    OBJECT_TYPES,
+    WWISE_TYPE_DESCRIPTIONS,
+)
+
 if TYPE_CHECKING:
     from ue_audio_mcp.knowledge.db import KnowledgeDB
 
 log = logging.getLogger(__name__)
 
+# Short alias: everything before the first parenthesis
+_SHORT_RE = re.compile(r'^(.+?)\s*\(')
+
+# Wwise object type -> wwise_types.category
+_WWISE_TYPE_CATEGORIES: dict[str, str] = {
+    "Sound": "audio_object",
+    "RandomSequenceContainer": "container",
+    "SwitchContainer": "container",
+    "BlendContainer": "container",
+    "ActorMixer": "container",
+    "Event": "event",
+    "Action": "event",
+    "Bus": "bus",
+    "AuxBus": "bus",
+    "WorkUnit": "structure",
+    "Folder": "structure",
+    "Attenuation": "shareset",
+    "SoundBank": "output",
+    "GameParameter": "game_sync",
+    "SwitchGroup": "game_sync",
+    "Switch": "game_sync",
+    "StateGroup": "game_sync",
+    "State": "game_sync",
+    "Trigger": "game_sync",
+}
+
+# blueprint_audio sources use 'category' for the class (GameplayStatics, ...);
+# map it to the UE5 class prefix for the class_name DB column
+_BP_AUDIO_CLASS_MAP: dict[str, str] = {
+    "GameplayStatics": "UGameplayStatics",
+    "AudioComponent": "UAudioComponent",
+    "AudioVolume": "AAudioVolume",
+    "Quartz": "UQuartzSubsystem",
+}
+
+
+# The 6 game audio patterns: (name, pattern_type, description, complexity, key_nodes)
+_AUDIO_PATTERNS: tuple[tuple[str, str, str, int, list[str]], ...] = (
+    ("gunshot", "weapon",
+     "Non-repetitive weapon fire with layered components and pitch randomization",
+     3, ["Random Get", "Wave Player (Mono)", "ADSR Envelope (Audio)", "Stereo Mixer", "Random Float"]),
+    ("footsteps", "movement",
+     "Surface-aware randomized footstep audio with per-surface filtering",
+     3, ["Trigger Route", "Array Random Get", "Wave Player (Mono)", "AD Envelope (Audio)", "One-Pole Low Pass Filter"]),
+    ("ambient", "environment",
+     "Looping layered environmental audio with natural variation",
+     4, ["Wave Player (Stereo)", "Trigger Repeat", "Random Get", "Stereo Panner", "LFO"]),
+    ("spatial", "spatialization",
+     "3D positioned audio with binaural rendering",
+     2, ["ITD Panner", "Stereo Panner", "Mid-Side Encode/Decode"]),
+    ("ui_sound", "interface",
+     "Non-spatial UI feedback sounds with procedural synthesis option",
+     2, ["Sine", "AD Envelope (Audio)", "Trigger Route", "Wave Player (Mono)"]),
+    ("weather_states", "state_switch",
+     "Game state driven audio transitions between weather profiles",
+     4, ["Trigger Route", "Crossfade", "InterpTo", "Dynamic Filter", "Wave Player (Stereo)"]),
+)
+
+_AUDIO_PATTERN_ROWS: tuple[tuple[str, str, str, str, int, str], ...] = tuple(
+    (name, pattern_type, description, "{}", complexity, json.dumps(key_nodes))
+    for name, pattern_type, description, complexity, key_nodes in _AUDIO_PATTERNS
+)
+
+# UE game reference implementations: (name, game, system_type, description, details)
+_GAME_EXAMPLES: tuple[tuple[str, str, str, str, dict[str, str | list[str]]], ...] = (
+    ("lyra_whizby", "Lyra", "weapon",
+     "Bullet flyby with incoming/receding phases and reflection system",
+     {"patch": "lib_Whizby", "features": ["8-tap delay", "frequency clamping", "convolution reverb"]}),
+    ("lyra_dovetail", "Lyra", "transition",
+     "Blends previous audio with new results using stereo balance",
+     {"patch": "lib_DovetailClip"}),
+    ("lyra_ambient", "Lyra", "ambient",
+     "Randomized ambient sounds with initial delays",
+     {"patch": "mx_PlayAmbientElement", "features": ["random delays", "environmental variation"]}),
+    ("lyra_music", "Lyra", "music",
+     "5-layer vertical music remixing with intensity tracking",
+     {"patch": "mx_Stingers", "layers": ["bass", "percussion-deep", "percussion-light", "pad", "lead"]}),
+    ("lyra_submix", "Lyra", "routing",
+     "Submix architecture: Master > UI/SFX/Music/Voice/Reverb",
+     {"buses": ["UISubmix", "SFXSubmix", "MusicSubmix", "VoiceSubmix", "ReverbSubmix"]}),
+)
+
+_GAME_EXAMPLE_ROWS: tuple[tuple[str, str, str, str, str], ...] = tuple(
+    (name, game, system_type, description, json.dumps(details))
+    for name, game, system_type, description, details in _GAME_EXAMPLES
+)
+
+# Static tutorial data, split into (name, description, details...) rows once
+_SPATIALIZATION_ROWS: tuple[tuple[str, str, str], ...] = tuple(
+    (
+        name,
+        data["description"],
+        json.dumps({k: v for k, v in data.items() if k != "description"}),
+    )
+    for name, data in SPATIALIZATION_METHODS.items()
+)
+
+_ATTENUATION_ROWS: tuple[tuple[str, str, str, str], ...] = tuple(
+    (
+        name,
+        data["description"],
+        json.dumps(data.get("params", [])),
+        json.dumps({k: v for k, v in data.items()
+                    if k not in ("description", "params")}),
+    )
+    for name, data in ATTENUATION_SUBSYSTEMS.items()
+)
+
+# TechAudioTools engine plugin assets: (name, asset_type, path, properties)
+_ENGINE_PLUGIN_ASSETS: tuple[tuple[str, str, str, list[str]], ...] = (
+    # --- SFX Generator: main source ---
+    ("MSS_SFXGenerator", "MetaSoundSource",
+     "/TechAudioToolsContent/Tools/SoundGenerator/MSS_SFXGenerator",
+     ["7-stage procedural SFX", "oscillator→FM→AM→effects→output",
+      "UI widget with knobs and toggles"]),
+    # --- Generators (oscillator patches) ---
+    ("MSP_SG_Generator_Sine", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Sine",
+     ["sine oscillator", "generator stage"]),
+    ("MSP_SG_Generator_Saw", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Saw",
+     ["sawtooth oscillator", "generator stage"]),
+    ("MSP_SG_Generator_Square", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Square",
+     ["square wave oscillator", "generator stage"]),
+    ("MSP_SG_Generator_Triangle", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Triangle",
+     ["triangle wave oscillator", "generator stage"]),
+    ("MSP_SG_Generator_Noise", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Noise",
+     ["noise generator", "generator stage"]),
+    # --- FM modulation ---
+    ("MSP_SG_FM_Vibrato", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FM_Vibrato",
+     ["FM vibrato", "modulation stage"]),
+    ("MSP_SG_FM_PitchSlide", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FM_PitchSlide",
+     ["FM pitch slide", "modulation stage"]),
+    # --- AM modulation ---
+    ("MSP_SG_AM_LFO", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_AM_LFO",
+     ["AM LFO modulation", "modulation stage"]),
+    # --- Inline effects (serial chain) ---
+    ("MSP_SG_FX_InlineFilter", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_InlineFilter",
+     ["inline filter", "effect stage"]),
+    ("MSP_SG_FX_InlineBitcrusher", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_InlineBitcrusher",
+     ["inline bitcrusher", "effect stage"]),
+    ("MSP_SG_FX_InlineRingmod", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_InlineRingmod",
+     ["inline ring modulation", "effect stage"]),
+    ("MSP_SG_FX_InlineWaveShaper", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_InlineWaveShaper",
+     ["inline wave shaper distortion", "effect stage"]),
+    # --- Send effects (parallel) ---
+    ("MSP_SG_FX_SendDelay", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_SendDelay",
+     ["send delay", "effect stage"]),
+    ("MSP_SG_FX_SendReverb", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_SendReverb",
+     ["send reverb", "effect stage"]),
+    ("MSP_SG_FX_SendFlanger", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_SendFlanger",
+     ["send flanger", "effect stage"]),
+    # --- Game SFX ---
+    ("MSP_SG_MultiStageJump", "MetaSoundPatch",
+     "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_MultiStageJump",
+     ["multi-stage jump SFX", "attack→sustain→release"]),
+    # --- Audio buses ---
+    ("AB_SFXG_Osc", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Osc",
+     ["oscillator bus"]),
+    ("AB_SFXG_Filter", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Filter",
+     ["filter bus"]),
+    ("AB_SFXG_BitCrusher", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_BitCrusher",
+     ["bitcrusher bus"]),
+    ("AB_SFXG_RingMod", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_RingMod",
+     ["ring mod bus"]),
+    ("AB_SFXG_WaveShaper", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_WaveShaper",
+     ["wave shaper bus"]),
+    ("AB_SFXG_Delay", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Delay",
+     ["delay bus"]),
+    ("AB_SFXG_Reverb", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Reverb",
+     ["reverb bus"]),
+    ("AB_SFXG_Vibrato", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Vibrato",
+     ["vibrato bus"]),
+    ("AB_SFXG_PitchBend", "AudioBus",
+     "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_PitchBend",
+     ["pitch bend bus"]),
+)
+
+# Full project_audio_assets rows, with properties JSON-encoded once at import
+_ENGINE_PLUGIN_ROWS: tuple[tuple[str, str, str, str, str, str, str, str], ...] = tuple(
+    (name, "__engine__", asset_type, path, "[]", json.dumps(props), "{}", "TechAudioTools")
+    for name, asset_type, path, props in _ENGINE_PLUGIN_ASSETS
+)
+
+
+def seed_database(
+    db: KnowledgeDB, only: Iterable[str] | None = None,
+) -> dict[str, int]:
+    """Populate tables from static data. Returns counts per table.
+
+    ``only`` restricts the run to the named _SEEDERS entries, e.g.
+    ``{"metasound_nodes", "node_aliases"}`` after editing the node catalogue.
+    """
+    if only is None:
+        seeders = _SEEDERS
+    else:
+        wanted = set(only)
+        unknown = wanted - _SEEDERS.keys()
+        if unknown:
+            raise ValueError("Unknown seeders: {}".format(", ".join(sorted(unknown))))
+        seeders = {name: fn for name, fn in _SEEDERS.items() if name in wanted}
 
-def seed_database(db: KnowledgeDB) -> dict[str, int]:
-    """Populate all tables from static data. Returns counts per table."""
     counts: dict[str, int] = {}
-
-    counts["metasound_nodes"] = _seed_metasound_nodes(db)
-    counts["wwise_types"] = _seed_wwise_types(db)
-    counts["waapi_functions"] = _seed_waapi_functions(db)
-    counts["audio_patterns"] = _seed_audio_patterns(db)
-    counts["ue_game_examples"] = _seed_game_examples(db)
-    counts["blueprint_audio"] = _seed_blueprint_audio(db)
-    counts["blueprint_nodes_scraped"] = _seed_blueprint_scraped(db)
-    counts["builder_api_functions"] = _seed_builder_api(db)
-    counts["tutorial_workflows"] = _seed_tutorial_workflows(db)
-    counts["audio_console_commands"] = _seed_console_commands(db)
-    counts["spatialization_methods"] = _seed_spatialization(db)
-    counts["attenuation_subsystems"] = _seed_attenuation(db)
-    counts["pin_mappings"] = _seed_pin_mappings(db)
-    counts["node_aliases"] = _seed_node_aliases(db)
-    counts["engine_plugins"] = _seed_engine_plugins(db)
-
-    total = sum(counts.values())
-    log.info("Seeded knowledge DB: %d total entries %s", total, counts)
+    # One transaction for the whole seed, with fsync and cache tuned for bulk
+    # load; tables that start out empty get their indexes built afterwards.
+    tables = [_SEEDER_TABLES.get(name, name) for name in seeders]
+    with db.bulk_load(defer_indexes=tables):
+        for name, seed in seeders.items():
+            counts[name] = seed(db)
+
+    if log.isEnabledFor(logging.INFO):
+        log.info("Seeded knowledge DB: %d total entries %s",
+                 sum(counts.values()), counts)
     return counts
 
 
-def _infer_variant_group(name: str) -> str:
-    """Infer variant group from node name.
-
-    'Audio Mixer (Stereo, 3)' -> 'Audio Mixer (Stereo)'
-    'Trigger Any (4)'         -> 'Trigger Any'
-    'Clamp (Float)'           -> 'Clamp'
-    'Sine'                    -> ''  (no variant)
-    """
-    import re
-    # Pattern: "Name (Type, N)" -> "Name (Type)"
-    m = re.match(r'^(.+?)\s*\(([^,]+),\s*\d+\)$', name)
-    if m:
-        return f"{m.group(1)} ({m.group(2).strip()})"
-    # Pattern: "Name (N)" where N is a digit -> "Name"
-    m = re.match(r'^(.+?)\s*\(\d+\)$', name)
-    if m:
-        return m.group(1).strip()
-    # Pattern: "Name (Type)" -> "Name"  (e.g. Clamp (Float) -> Clamp)
-    m = re.match(r'^(.+?)\s*\([^)]+\)$', name)
-    if m:
-        base = m.group(1).strip()
-        # Only group if there are other variants with same base
-        return base
-    return ""
-
-
 def _seed_metasound_nodes(db: KnowledgeDB) -> int:
-    from ue_audio_mcp.knowledge.metasound_nodes import METASOUND_NODES
-
-    for node in METASOUND_NODES.values():
-        enriched = dict(node)
-        if not enriched.get("variant_group"):
-            enriched["variant_group"] = _infer_variant_group(enriched["name"])
-        if not enriched.get("source"):
-            enriched["source"] = "catalogue"
-        db.insert_node(enriched)
-    return len(METASOUND_NODES)
+    return db.insert_nodes_batch(
+        (
+            node["name"],
+            node["category"],
+            node["description"],
+            json.dumps(node["inputs"]),
+            json.dumps(node["outputs"]),
+            json.dumps(node["tags"]),
+            node.get("complexity", 2),
+            node.get("class_name", ""),
+            node.get("variant_group") or _infer_variant_group(node["name"]),
+            node.get("source") or "catalogue",
+            node.get("mcp_note", ""),
+        )
+        for node in METASOUND_NODES.values()
+    )
 
 
 def _seed_wwise_types(db: KnowledgeDB) -> int:
-    from ue_audio_mcp.knowledge.wwise_types import (
-        OBJECT_TYPES,
-        COMMON_PROPERTIES,
-        WWISE_TYPE_DESCRIPTIONS,
-    )
-
-    count = 0
-    type_categories = {
-        "Sound": "audio_object",
-        "RandomSequenceContainer": "container",
-        "SwitchContainer": "container",
-        "BlendContainer": "container",
-        "ActorMixer": "container",
-        "Event": "event",
-        "Action": "event",
-        "Bus": "bus",
-        "AuxBus": "bus",
-        "WorkUnit": "structure",
-        "Folder": "structure",
-        "Attenuation": "shareset",
-        "SoundBank": "output",
-        "GameParameter": "game_sync",
-        "SwitchGroup": "game_sync",
-        "Switch": "game_sync",
-        "StateGroup": "game_sync",
-        "State": "game_sync",
-        "Trigger": "game_sync",
-    }
+    # Every type shares the same property list -- encode it once
+    properties = json.dumps(list(COMMON_PROPERTIES))
+    rows = []
     for type_name in OBJECT_TYPES:
-        cat = type_categories.get(type_name, "other")
-        db.insert_wwise_type({
-            "type_name": type_name,
-            "category": cat,
-            "description": WWISE_TYPE_DESCRIPTIONS.get(
-                type_name, "Wwise {} object".format(type_name)
-            ),
-            "properties": list(COMMON_PROPERTIES.keys()),
-        })
-        count += 1
-    return count
+        desc = WWISE_TYPE_DESCRIPTIONS.get(type_name)
+        if desc is None:
+            desc = f"Wwise {type_name} object"
+        rows.append((
+            type_name,
+            _WWISE_TYPE_CATEGORIES.get(type_name, "other"),
+            desc,
+            properties,
+        ))
+    return db.insert_wwise_types_batch(rows)
 
 
 def _seed_waapi_functions(db: KnowledgeDB) -> int:
     """Seed WAAPI functions from the waapi_functions catalogue."""
-    from ue_audio_mcp.knowledge.waapi_functions import WAAPI_FUNCTIONS
-
-    for uri, func in WAAPI_FUNCTIONS.items():
-        operation = uri.rsplit(".", 1)[-1]
-        db.insert_waapi({
-            "uri": uri,
-            "namespace": func["namespace"],
-            "operation": operation,
-            "description": func["description"],
-            "params": func.get("params", []),
-            "returns": func.get("returns"),
-        })
-    return len(WAAPI_FUNCTIONS)
+    return db.insert_waapi_batch(
+        (
+            uri,
+            func["namespace"],
+            func["operation"],
+            func["description"],
+            json.dumps(func.get("params", [])),
+            json.dumps(func.get("returns")),
+        )
+        for uri, func in WAAPI_FUNCTIONS.items()
+    )
 
 
 def _seed_audio_patterns(db: KnowledgeDB) -> int:
     """Seed the 6 game audio patterns."""
-    patterns = [
-        {
-            "name": "gunshot",
-            "pattern_type": "weapon",
-            "description": "Non-repetitive weapon fire with layered components and pitch randomization",
-            "complexity": 3,
-            "key_nodes": ["Random Get", "Wave Player (Mono)", "ADSR Envelope (Audio)", "Stereo Mixer", "Random Float"],
-        },
-        {
-            "name": "footsteps",
-            "pattern_type": "movement",
-            "description": "Surface-aware randomized footstep audio with per-surface filtering",
-            "complexity": 3,
-            "key_nodes": ["Trigger Route", "Array Random Get", "Wave Player (Mono)", "AD Envelope (Audio)", "One-Pole Low Pass Filter"],
-        },
-        {
-            "name": "ambient",
-            "pattern_type": "environment",
-            "description": "Looping layered environmental audio with natural variation",
-            "complexity": 4,
-            "key_nodes": ["Wave Player (Stereo)", "Trigger Repeat", "Random Get", "Stereo Panner", "LFO"],
-        },
-        {
-            "name": "spatial",
-            "pattern_type": "spatialization",
-            "description": "3D positioned audio with binaural rendering",
-            "complexity": 2,
-            "key_nodes": ["ITD Panner", "Stereo Panner", "Mid-Side Encode/Decode"],
-        },
-        {
-            "name": "ui_sound",
-            "pattern_type": "interface",
-            "description": "Non-spatial UI feedback sounds with procedural synthesis option",
-            "complexity": 2,
-            "key_nodes": ["Sine", "AD Envelope (Audio)", "Trigger Route", "Wave Player (Mono)"],
-        },
-        {
-            "name": "weather_states",
-            "pattern_type": "state_switch",
-            "description": "Game state driven audio transitions between weather profiles",
-            "complexity": 4,
-            "key_nodes": ["Trigger Route", "Crossfade", "InterpTo", "Dynamic Filter", "Wave Player (Stereo)"],
-        },
-    ]
-    for p in patterns:
-        db.insert_pattern(p)
-    return len(patterns)
+    return db.insert_patterns_batch(_AUDIO_PATTERN_ROWS)
 
 
 def _seed_game_examples(db: KnowledgeDB) -> int:
     """Seed UE game reference implementations."""
-    examples = [
-        {
-            "name": "lyra_whizby",
-            "game": "Lyra",
-            "system_type": "weapon",
-            "description": "Bullet flyby with incoming/receding phases and reflection system",
-            "details": {"patch": "lib_Whizby", "features": ["8-tap delay", "frequency clamping", "convolution reverb"]},
-        },
-        {
-            "name": "lyra_dovetail",
-            "game": "Lyra",
-            "system_type": "transition",
-            "description": "Blends previous audio with new results using stereo balance",
-            "details": {"patch": "lib_DovetailClip"},
-        },
-        {
-            "name": "lyra_ambient",
-            "game": "Lyra",
-            "system_type": "ambient",
-            "description": "Randomized ambient sounds with initial delays",
-            "details": {"patch": "mx_PlayAmbientElement", "features": ["random delays", "environmental variation"]},
-        },
-        {
-            "name": "lyra_music",
-            "game": "Lyra",
-            "system_type": "music",
-            "description": "5-layer vertical music remixing with intensity tracking",
-            "details": {"patch": "mx_Stingers", "layers": ["bass", "percussion-deep", "percussion-light", "pad", "lead"]},
-        },
-        {
-            "name": "lyra_submix",
-            "game": "Lyra",
-            "system_type": "routing",
-            "description": "Submix architecture: Master > UI/SFX/Music/Voice/Reverb",
-            "details": {"buses": ["UISubmix", "SFXSubmix", "MusicSubmix", "VoiceSubmix", "ReverbSubmix"]},
-        },
-    ]
-    for ex in examples:
-        db.insert_example(ex)
-    return len(examples)
+    return db.insert_examples_batch(_GAME_EXAMPLE_ROWS)
 
 
 def _seed_blueprint_audio(db: KnowledgeDB) -> int:
     """Seed Blueprint audio functions from the blueprint_audio catalogue."""
-    from ue_audio_mcp.knowledge.blueprint_audio import BLUEPRINT_AUDIO_FUNCTIONS
-
-    # Source uses 'category' for class name (GameplayStatics, AudioComponent, etc.)
-    # Map to UE5 class prefixes for the class_name DB column
-    _CLASS_MAP = {
-        "GameplayStatics": "UGameplayStatics",
-        "AudioComponent": "UAudioComponent",
-        "AudioVolume": "AAudioVolume",
-        "Quartz": "UQuartzSubsystem",
-    }
-    for name, func in BLUEPRINT_AUDIO_FUNCTIONS.items():
-        source_cat = func["category"]
-        db.insert_blueprint_audio({
-            "name": name,
-            "class_name": _CLASS_MAP.get(source_cat, source_cat),
-            "category": source_cat.lower(),
-            "description": func["description"],
-            "params": func.get("params", []),
-            "returns": func.get("returns"),
-            "tags": func.get("tags", []),
-        })
-    return len(BLUEPRINT_AUDIO_FUNCTIONS)
-
+    return db.insert_blueprint_audio_batch(
+        (
+            name,
+            _BP_AUDIO_CLASS_MAP.get(func["category"], func["category"]),
+            func["category"].lower(),
+            func["description"],
+            json.dumps(func.get("params", [])),
+            json.dumps(func.get("returns")),
+            json.dumps(func.get("tags", [])),
+        )
+        for name, func in BLUEPRINT_AUDIO_FUNCTIONS.items()
+    )
 
 
 def _seed_blueprint_scraped(db: KnowledgeDB) -> int:
@@ -269,93 +363,72 @@ def _seed_blueprint_scraped(db: KnowledgeDB) -> int:
     Loads curated functions from blueprint_audio_catalogue.json (55 entries)
     instead of the old 26K-node scraped bp_node_specs.json.
     """
-    from ue_audio_mcp.knowledge.blueprint_scraped import load_scraped_nodes
-
     nodes = load_scraped_nodes()
     if not nodes:
         return 0
-    rows = [
-        {
-            "name": name,
-            "target": spec.get("target", ""),
-            "category": spec.get("category", ""),
-            "description": spec.get("description", ""),
-            "inputs": spec.get("inputs", []),
-            "outputs": spec.get("outputs", []),
-            "slug": spec.get("slug", ""),
-            "ue_version": spec.get("ue_version", ""),
-            "path": spec.get("path", ""),
-        }
-        for name, spec in nodes.items()
-    ]
+    # Specs already carry every column; insert_blueprint_scraped_batch
+    # fills defaults and encodes inputs/outputs once per row.
+    rows = [{"name": name, **spec} for name, spec in nodes.items()]
     db.insert_blueprint_scraped_batch(rows)
     return len(rows)
 
 
 def _seed_builder_api(db: KnowledgeDB) -> int:
     """Seed MetaSound Builder API functions from tutorials catalogue."""
-    from ue_audio_mcp.knowledge.tutorials import BUILDER_API_FUNCTIONS
-
-    for func in BUILDER_API_FUNCTIONS:
-        db.insert_builder_api(func)
-    return len(BUILDER_API_FUNCTIONS)
+    return db.insert_builder_api_batch(
+        (
+            func["name"], func["category"], func["description"],
+            json.dumps(func.get("params", [])),
+        )
+        for func in BUILDER_API_FUNCTIONS
+    )
 
 
 def _seed_tutorial_workflows(db: KnowledgeDB) -> int:
     """Seed tutorial workflow references."""
-    from ue_audio_mcp.knowledge.tutorials import TUTORIAL_WORKFLOWS
-
-    for wf in TUTORIAL_WORKFLOWS:
-        db.insert_tutorial_workflow(wf)
-    return len(TUTORIAL_WORKFLOWS)
+    return db.insert_tutorial_workflows_batch(
+        (
+            wf["name"],
+            wf["tutorial"],
+            wf.get("url", ""),
+            json.dumps(wf.get("layers", [])),
+            wf.get("description", ""),
+            json.dumps(wf.get("tags", [])),
+            wf.get("blueprint_template", ""),
+            wf.get("metasound_template", ""),
+        )
+        for wf in TUTORIAL_WORKFLOWS
+    )
 
 
 def _seed_console_commands(db: KnowledgeDB) -> int:
     """Seed audio console commands from tutorials catalogue."""
-    from ue_audio_mcp.knowledge.tutorials import AUDIO_CONSOLE_COMMANDS
-
-    count = 0
-    for category, cmds in AUDIO_CONSOLE_COMMANDS.items():
-        for cmd in cmds:
-            row = {**cmd, "category": category}
-            db.insert_console_command(row)
-            count += 1
-    return count
+    return db.insert_console_commands_batch(
+        (
+            cmd["cmd"],
+            category,
+            cmd.get("type", "bool"),
+            "" if cmd.get("default") is None else json.dumps(cmd["default"]),
+            cmd.get("description", ""),
+        )
+        for category, cmds in AUDIO_CONSOLE_COMMANDS.items()
+        for cmd in cmds
+    )
 
 
 def _seed_spatialization(db: KnowledgeDB) -> int:
     """Seed spatialization methods."""
-    from ue_audio_mcp.knowledge.tutorials import SPATIALIZATION_METHODS
-
-    for name, data in SPATIALIZATION_METHODS.items():
-        db.insert_spatialization({
-            "name": name,
-            "description": data["description"],
-            "details": {k: v for k, v in data.items() if k != "description"},
-        })
-    return len(SPATIALIZATION_METHODS)
+    return db.insert_spatialization_batch(_SPATIALIZATION_ROWS)
 
 
 def _seed_attenuation(db: KnowledgeDB) -> int:
     """Seed attenuation subsystems."""
-    from ue_audio_mcp.knowledge.tutorials import ATTENUATION_SUBSYSTEMS
-
-    for name, data in ATTENUATION_SUBSYSTEMS.items():
-        db.insert_attenuation({
-            "name": name,
-            "description": data["description"],
-            "params": data.get("params", []),
-            "details": {k: v for k, v in data.items()
-                        if k not in ("description", "params")},
-        })
-    return len(ATTENUATION_SUBSYSTEMS)
+    return db.insert_attenuation_batch(_ATTENUATION_ROWS)
 
 
 def _seed_pin_mappings(db: KnowledgeDB) -> int:
     """Seed cross-system pin mappings (BP <-> MetaSounds <-> Wwise)."""
-    from ue_audio_mcp.knowledge.bp_ms_pin_mappings import PIN_MAPPINGS
-
-    return db.insert_pin_mappings_batch(PIN_MAPPINGS)
+    return db.insert_pin_mappings_batch(PIN_MAPPINGS, replace=True)
 
 
 def _seed_node_aliases(db: KnowledgeDB) -> int:
@@ -363,43 +436,44 @@ def _seed_node_aliases(db: KnowledgeDB) -> int:
 
     Creates aliases of types: 'display', 'class_name', 'short'.
     """
-    from ue_audio_mcp.knowledge.metasound_nodes import (
-        CLASS_NAME_TO_DISPLAY,
-        DISPLAY_TO_CLASS,
-        METASOUND_NODES,
-    )
-
     aliases: list[tuple[str, str, str]] = []  # (alias, canonical, alias_type)
+    short_counts: Counter[str] = Counter()
+    short_target: dict[str, str] = {}
 
+    # One pass over the catalogue:
     # 1. Display name -> canonical (identity, for completeness)
+    # 2. Short names (strip parenthetical suffixes), tallied for step 2b
     for name in METASOUND_NODES:
         aliases.append((name, name, "display"))
-
-    # 2. Class name -> canonical
-    for class_name, display_name in CLASS_NAME_TO_DISPLAY.items():
-        if display_name in METASOUND_NODES:
-            aliases.append((class_name, display_name, "class_name"))
-
-    # 3. Short names (strip parenthetical suffixes)
-    import re
-    seen_shorts: set[str] = set()
-    for name in METASOUND_NODES:
-        m = re.match(r'^(.+?)\s*\(', name)
+        m = _SHORT_RE.match(name)
         if m:
             short = m.group(1).strip()
-            # Only add if the short name is unambiguous (maps to one node)
-            # or if it's already been added as an extra alias
-            if short not in METASOUND_NODES and short not in seen_shorts:
-                aliases.append((short, name, "short"))
-                seen_shorts.add(short)
+            short_counts[short] += 1
+            short_target.setdefault(short, name)
+
+    # 2b. Only unambiguous short names (exactly one variant, not itself a node)
+    aliases.extend(
+        (short, short_target[short], "short")
+        for short, n in short_counts.items()
+        if n == 1 and short not in METASOUND_NODES
+    )
+
+    # 3. Class name -> canonical
+    aliases.extend(
+        (class_name, display_name, "class_name")
+        for class_name, display_name in CLASS_NAME_TO_DISPLAY.items()
+        if display_name in METASOUND_NODES
+    )
 
     # 4. Extra display->class aliases
-    for display_name, class_name in DISPLAY_TO_CLASS.items():
-        canonical = CLASS_NAME_TO_DISPLAY.get(class_name, display_name)
-        if canonical in METASOUND_NODES and display_name != canonical:
-            aliases.append((display_name, canonical, "display"))
+    aliases.extend(
+        (dn, canonical, "display")
+        for dn, cn in DISPLAY_TO_CLASS.items()
+        if (canonical := CLASS_NAME_TO_DISPLAY.get(cn, dn)) in METASOUND_NODES
+        and dn != canonical
+    )
 
-    return db.insert_node_aliases_batch(aliases)
+    return db.insert_node_aliases_batch(aliases, replace=True)
 
 
 def _seed_engine_plugins(db: KnowledgeDB) -> int:
@@ -408,176 +482,29 @@ def _seed_engine_plugins(db: KnowledgeDB) -> int:
     These are in Engine/Plugins/ and available in every project — no migration needed.
     Stored with project='__engine__' so agents can discover them.
     """
-    assets = [
-        # --- SFX Generator: main source ---
-        {
-            "name": "MSS_SFXGenerator",
-            "category": "MetaSoundSource",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/MSS_SFXGenerator",
-            "properties": ["7-stage procedural SFX", "oscillator→FM→AM→effects→output",
-                           "UI widget with knobs and toggles"],
-        },
-        # --- Generators (oscillator patches) ---
-        {
-            "name": "MSP_SG_Generator_Sine",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Sine",
-            "properties": ["sine oscillator", "generator stage"],
-        },
-        {
-            "name": "MSP_SG_Generator_Saw",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Saw",
-            "properties": ["sawtooth oscillator", "generator stage"],
-        },
-        {
-            "name": "MSP_SG_Generator_Square",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Square",
-            "properties": ["square wave oscillator", "generator stage"],
-        },
-        {
-            "name": "MSP_SG_Generator_Triangle",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Triangle",
-            "properties": ["triangle wave oscillator", "generator stage"],
-        },
-        {
-            "name": "MSP_SG_Generator_Noise",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_Generator_Noise",
-            "properties": ["noise generator", "generator stage"],
-        },
-        # --- FM modulation ---
-        {
-            "name": "MSP_SG_FM_Vibrato",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FM_Vibrato",
-            "properties": ["FM vibrato", "modulation stage"],
-        },
-        {
-            "name": "MSP_SG_FM_PitchSlide",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FM_PitchSlide",
-            "properties": ["FM pitch slide", "modulation stage"],
-        },
-        # --- AM modulation ---
-        {
-            "name": "MSP_SG_AM_LFO",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_AM_LFO",
-            "properties": ["AM LFO modulation", "modulation stage"],
-        },
-        # --- Inline effects (serial chain) ---
-        {
-            "name": "MSP_SG_FX_InlineFilter",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_InlineFilter",
-            "properties": ["inline filter", "effect stage"],
-        },
-        {
-            "name": "MSP_SG_FX_InlineBitcrusher",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_InlineBitcrusher",
-            "properties": ["inline bitcrusher", "effect stage"],
-        },
-        {
-            "name": "MSP_SG_FX_InlineRingmod",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_InlineRingmod",
-            "properties": ["inline ring modulation", "effect stage"],
-        },
-        {
-            "name": "MSP_SG_FX_InlineWaveShaper",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_InlineWaveShaper",
-            "properties": ["inline wave shaper distortion", "effect stage"],
-        },
-        # --- Send effects (parallel) ---
-        {
-            "name": "MSP_SG_FX_SendDelay",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_SendDelay",
-            "properties": ["send delay", "effect stage"],
-        },
-        {
-            "name": "MSP_SG_FX_SendReverb",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_SendReverb",
-            "properties": ["send reverb", "effect stage"],
-        },
-        {
-            "name": "MSP_SG_FX_SendFlanger",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_FX_SendFlanger",
-            "properties": ["send flanger", "effect stage"],
-        },
-        # --- Game SFX ---
-        {
-            "name": "MSP_SG_MultiStageJump",
-            "category": "MetaSoundPatch",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/Patches/MSP_SG_MultiStageJump",
-            "properties": ["multi-stage jump SFX", "attack→sustain→release"],
-        },
-        # --- Audio buses ---
-        {
-            "name": "AB_SFXG_Osc",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Osc",
-            "properties": ["oscillator bus"],
-        },
-        {
-            "name": "AB_SFXG_Filter",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Filter",
-            "properties": ["filter bus"],
-        },
-        {
-            "name": "AB_SFXG_BitCrusher",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_BitCrusher",
-            "properties": ["bitcrusher bus"],
-        },
-        {
-            "name": "AB_SFXG_RingMod",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_RingMod",
-            "properties": ["ring mod bus"],
-        },
-        {
-            "name": "AB_SFXG_WaveShaper",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_WaveShaper",
-            "properties": ["wave shaper bus"],
-        },
-        {
-            "name": "AB_SFXG_Delay",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Delay",
-            "properties": ["delay bus"],
-        },
-        {
-            "name": "AB_SFXG_Reverb",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Reverb",
-            "properties": ["reverb bus"],
-        },
-        {
-            "name": "AB_SFXG_Vibrato",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_Vibrato",
-            "properties": ["vibrato bus"],
-        },
-        {
-            "name": "AB_SFXG_PitchBend",
-            "category": "AudioBus",
-            "path": "/TechAudioToolsContent/Tools/SoundGenerator/AudioBuses/AB_SFXG_PitchBend",
-            "properties": ["pitch bend bus"],
-        },
-    ]
-
-    count = 0
-    for asset in assets:
-        db.insert_project_asset(asset, project="__engine__", source="TechAudioTools")
-        count += 1
-    return count
+    return db.insert_project_assets_batch(_ENGINE_PLUGIN_ROWS)
+
+
+# Seed phases in run order, keyed by the name reported in seed_database() counts
+_SEEDERS: dict[str, Callable[[KnowledgeDB], int]] = {
+    "metasound_nodes": _seed_metasound_nodes,
+    "wwise_types": _seed_wwise_types,
+    "waapi_functions": _seed_waapi_functions,
+    "audio_patterns": _seed_audio_patterns,
+    "ue_game_examples": _seed_game_examples,
+    "blueprint_audio": _seed_blueprint_audio,
+    "blueprint_nodes_scraped": _seed_blueprint_scraped,
+    "builder_api_functions": _seed_builder_api,
+    "tutorial_workflows": _seed_tutorial_workflows,
+    "audio_console_commands": _seed_console_commands,
+    "spatialization_methods": _seed_spatialization,
+    "attenuation_subsystems": _seed_attenuation,
+    "pin_mappings": _seed_pin_mappings,
+    "node_aliases": _seed_node_aliases,
+    "engine_plugins": _seed_engine_plugins,
+}
+
+# _SEEDERS entries whose counts key differs from the table they write
+_SEEDER_TABLES: dict[str, str] = {
+    "engine_plugins": "project_audio_assets",
+}
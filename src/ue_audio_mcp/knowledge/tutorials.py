@@ -34,58 +34,58 @@ METASOUND_PIN_TYPES = {
     "Trigger": {
         "description": "Pulse signal, fires once then resets",
         "color": "white",
-        "connectable_to": ["Trigger"],
+        "connectable_to": ("Trigger",),
     },
     "Audio": {
         "description": "Audio-rate signal (sample buffer)",
         "color": "blue",
-        "connectable_to": ["Audio"],
+        "connectable_to": ("Audio",),
     },
     "Float": {
         "description": "32-bit floating point number",
         "color": "green",
-        "connectable_to": ["Float", "Audio"],
+        "connectable_to": ("Float", "Audio"),
         "note": "Float->Audio is control-rate, not sample-rate",
     },
     "Int32": {
         "description": "32-bit signed integer",
         "color": "teal",
-        "connectable_to": ["Int32", "Float"],
+        "connectable_to": ("Int32", "Float"),
     },
     "Bool": {
         "description": "Boolean true/false",
         "color": "red",
-        "connectable_to": ["Bool"],
+        "connectable_to": ("Bool",),
     },
     "Time": {
         "description": "Duration in seconds",
         "color": "orange",
-        "connectable_to": ["Time", "Float"],
+        "connectable_to": ("Time", "Float"),
     },
     "String": {
         "description": "Text string",
         "color": "magenta",
-        "connectable_to": ["String"],
+        "connectable_to": ("String",),
     },
     "WaveAsset": {
         "description": "Reference to a .wav file in Content",
         "color": "purple",
-        "connectable_to": ["WaveAsset"],
+        "connectable_to": ("WaveAsset",),
     },
     "Enum": {
         "description": "Enumeration value",
         "color": "yellow",
-        "connectable_to": ["Enum"],
+        "connectable_to": ("Enum",),
     },
 }
 
 # Implicit conversions allowed
-METASOUND_TYPE_CONVERSIONS = [
+METASOUND_TYPE_CONVERSIONS = (
     ("Int32", "Float"),
     ("Float", "Audio"),
     ("Time", "Float"),
     ("Bool", "Int32"),
-]
+)
 
 METASOUND_INTERFACES = {
     "UE.Source.OneShot": {
@@ -132,128 +132,128 @@ METASOUND_ASSET_TYPES = {
 # MetaSound Builder API (109 Blueprint functions)
 # ===================================================================
 
-BUILDER_API_FUNCTIONS = [
+BUILDER_API_FUNCTIONS = (
     # Source/Graph creation
-    {"name": "CreateSourceBuilder", "category": "creation", "description": "Create a new MetaSound Source builder", "params": ["Name"]},
-    {"name": "CreateSourcePresetBuilder", "category": "creation", "description": "Create a preset from an existing source", "params": ["Name", "ReferencedSource"]},
-    {"name": "CreatePatchBuilder", "category": "creation", "description": "Create a reusable patch builder", "params": ["Name"]},
-    {"name": "CreatePatchPresetBuilder", "category": "creation", "description": "Create a preset from an existing patch", "params": ["Name", "ReferencedPatch"]},
+    {"name": "CreateSourceBuilder", "category": "creation", "description": "Create a new MetaSound Source builder", "params": ("Name",)},
+    {"name": "CreateSourcePresetBuilder", "category": "creation", "description": "Create a preset from an existing source", "params": ("Name", "ReferencedSource")},
+    {"name": "CreatePatchBuilder", "category": "creation", "description": "Create a reusable patch builder", "params": ("Name",)},
+    {"name": "CreatePatchPresetBuilder", "category": "creation", "description": "Create a preset from an existing patch", "params": ("Name", "ReferencedPatch")},
 
     # Node operations
-    {"name": "AddNode", "category": "nodes", "description": "Add a node to the graph by class name", "params": ["ClassName"]},
-    {"name": "AddNodeByClassName", "category": "nodes", "description": "Add node using full class path", "params": ["ClassName"]},
-    {"name": "RemoveNode", "category": "nodes", "description": "Remove a node from the graph", "params": ["NodeHandle"]},
-    {"name": "FindNodeClassVersion", "category": "nodes", "description": "Get version of a node class", "params": ["ClassName"]},
-    {"name": "FindNodeClassIsNative", "category": "nodes", "description": "Check if node class is native C++", "params": ["ClassName"]},
+    {"name": "AddNode", "category": "nodes", "description": "Add a node to the graph by class name", "params": ("ClassName",)},
+    {"name": "AddNodeByClassName", "category": "nodes", "description": "Add node using full class path", "params": ("ClassName",)},
+    {"name": "RemoveNode", "category": "nodes", "description": "Remove a node from the graph", "params": ("NodeHandle",)},
+    {"name": "FindNodeClassVersion", "category": "nodes", "description": "Get version of a node class", "params": ("ClassName",)},
+    {"name": "FindNodeClassIsNative", "category": "nodes", "description": "Check if node class is native C++", "params": ("ClassName",)},
 
     # Connection operations
-    {"name": "ConnectNodes", "category": "connections", "description": "Connect output pin to input pin", "params": ["FromNode", "FromPin", "ToNode", "ToPin"]},
-    {"name": "ConnectNodesByInterfaceBindings", "category": "connections", "description": "Connect nodes using interface definitions", "params": ["FromNode", "ToNode"]},
-    {"name": "DisconnectNodes", "category": "connections", "description": "Disconnect two connected pins", "params": ["FromNode", "FromPin", "ToNode", "ToPin"]},
-    {"name": "DisconnectNodeInput", "category": "connections", "description": "Disconnect all connections to an input", "params": ["Node", "InputPin"]},
-    {"name": "DisconnectNodeOutput", "category": "connections", "description": "Disconnect all connections from an output", "params": ["Node", "OutputPin"]},
-    {"name": "NodesAreConnected", "category": "connections", "description": "Check if two pins are connected", "params": ["FromNode", "FromPin", "ToNode", "ToPin"]},
-    {"name": "GetNodeInputIsConstructorPin", "category": "connections", "description": "Check if input is set at construction only", "params": ["Node", "InputPin"]},
-    {"name": "GetNodeInputClassDefault", "category": "connections", "description": "Get default value for a node input", "params": ["Node", "InputPin"]},
+    {"name": "ConnectNodes", "category": "connections", "description": "Connect output pin to input pin", "params": ("FromNode", "FromPin", "ToNode", "ToPin")},
+    {"name": "ConnectNodesByInterfaceBindings", "category": "connections", "description": "Connect nodes using interface definitions", "params": ("FromNode", "ToNode")},
+    {"name": "DisconnectNodes", "category": "connections", "description": "Disconnect two connected pins", "params": ("FromNode", "FromPin", "ToNode", "ToPin")},
+    {"name": "DisconnectNodeInput", "category": "connections", "description": "Disconnect all connections to an input", "params": ("Node", "InputPin")},
+    {"name": "DisconnectNodeOutput", "category": "connections", "description": "Disconnect all connections from an output", "params": ("Node", "OutputPin")},
+    {"name": "NodesAreConnected", "category": "connections", "description": "Check if two pins are connected", "params": ("FromNode", "FromPin", "ToNode", "ToPin")},
+    {"name": "GetNodeInputIsConstructorPin", "category": "connections", "description": "Check if input is set at construction only", "params": ("Node", "InputPin")},
+    {"name": "GetNodeInputClassDefault", "category": "connections", "description": "Get default value for a node input", "params": ("Node", "InputPin")},
 
     # Input/Output (graph-level)
-    {"name": "AddGraphInputNode", "category": "graph_io", "description": "Add an input to the graph", "params": ["Name", "DataType", "DefaultValue"]},
-    {"name": "AddGraphOutputNode", "category": "graph_io", "description": "Add an output from the graph", "params": ["Name", "DataType"]},
-    {"name": "RemoveGraphInputNode", "category": "graph_io", "description": "Remove a graph input", "params": ["Name"]},
-    {"name": "RemoveGraphOutputNode", "category": "graph_io", "description": "Remove a graph output", "params": ["Name"]},
+    {"name": "AddGraphInputNode", "category": "graph_io", "description": "Add an input to the graph", "params": ("Name", "DataType", "DefaultValue")},
+    {"name": "AddGraphOutputNode", "category": "graph_io", "description": "Add an output from the graph", "params": ("Name", "DataType")},
+    {"name": "RemoveGraphInputNode", "category": "graph_io", "description": "Remove a graph input", "params": ("Name",)},
+    {"name": "RemoveGraphOutputNode", "category": "graph_io", "description": "Remove a graph output", "params": ("Name",)},
 
     # Interface operations
-    {"name": "AddInterface", "category": "interfaces", "description": "Add a MetaSound interface to the graph", "params": ["InterfaceName"]},
-    {"name": "RemoveInterface", "category": "interfaces", "description": "Remove interface from graph", "params": ["InterfaceName"]},
-    {"name": "FindInterfaceInputNodes", "category": "interfaces", "description": "Find nodes providing interface inputs", "params": ["InterfaceName"]},
-    {"name": "FindInterfaceOutputNodes", "category": "interfaces", "description": "Find nodes consuming interface outputs", "params": ["InterfaceName"]},
+    {"name": "AddInterface", "category": "interfaces", "description": "Add a MetaSound interface to the graph", "params": ("InterfaceName",)},
+    {"name": "RemoveInterface", "category": "interfaces", "description": "Remove interface from graph", "params": ("InterfaceName",)},
+    {"name": "FindInterfaceInputNodes", "category": "interfaces", "description": "Find nodes providing interface inputs", "params": ("InterfaceName",)},
+    {"name": "FindInterfaceOutputNodes", "category": "interfaces", "description": "Find nodes consuming interface outputs", "params": ("InterfaceName",)},
 
     # Node defaults
-    {"name": "SetNodeInputDefault", "category": "defaults", "description": "Set default value for node input", "params": ["Node", "InputPin", "Value"]},
-    {"name": "GetNodeInputDefault", "category": "defaults", "description": "Get current default value", "params": ["Node", "InputPin"]},
-    {"name": "RemoveNodeInputDefault", "category": "defaults", "description": "Remove default, reverting to class default", "params": ["Node", "InputPin"]},
+    {"name": "SetNodeInputDefault", "category": "defaults", "description": "Set default value for node input", "params": ("Node", "InputPin", "Value")},
+    {"name": "GetNodeInputDefault", "category": "defaults", "description": "Get current default value", "params": ("Node", "InputPin")},
+    {"name": "RemoveNodeInputDefault", "category": "defaults", "description": "Remove default, reverting to class default", "params": ("Node", "InputPin")},
 
     # Document / metadata
-    {"name": "SetGraphDisplayName", "category": "metadata", "description": "Set display name for the graph", "params": ["DisplayName"]},
-    {"name": "SetNodeLocation", "category": "metadata", "description": "Set visual position in editor", "params": ["Node", "X", "Y"]},
-    {"name": "SetNodeComment", "category": "metadata", "description": "Set comment text on a node", "params": ["Node", "Comment"]},
+    {"name": "SetGraphDisplayName", "category": "metadata", "description": "Set display name for the graph", "params": ("DisplayName",)},
+    {"name": "SetNodeLocation", "category": "metadata", "description": "Set visual position in editor", "params": ("Node", "X", "Y")},
+    {"name": "SetNodeComment", "category": "metadata", "description": "Set comment text on a node", "params": ("Node", "Comment")},
 
     # Audition / Preview
-    {"name": "Audition", "category": "preview", "description": "Play the graph in-editor for preview", "params": []},
-    {"name": "StopAudition", "category": "preview", "description": "Stop in-editor preview", "params": []},
-    {"name": "IsAuditioning", "category": "preview", "description": "Check if currently auditioning", "params": []},
+    {"name": "Audition", "category": "preview", "description": "Play the graph in-editor for preview", "params": ()},
+    {"name": "StopAudition", "category": "preview", "description": "Stop in-editor preview", "params": ()},
+    {"name": "IsAuditioning", "category": "preview", "description": "Check if currently auditioning", "params": ()},
 
     # Build / Export
-    {"name": "BuildToAsset", "category": "build", "description": "Compile graph to a UE asset", "params": ["PackagePath", "AssetName"]},
-    {"name": "BuildAndOverwriteAsset", "category": "build", "description": "Compile and replace existing asset", "params": ["ExistingAsset"]},
-    {"name": "IsPreset", "category": "build", "description": "Check if this builder is a preset", "params": []},
-    {"name": "GetRootGraphHandle", "category": "build", "description": "Get handle to the root graph", "params": []},
+    {"name": "BuildToAsset", "category": "build", "description": "Compile graph to a UE asset", "params": ("PackagePath", "AssetName")},
+    {"name": "BuildAndOverwriteAsset", "category": "build", "description": "Compile and replace existing asset", "params": ("ExistingAsset",)},
+    {"name": "IsPreset", "category": "build", "description": "Check if this builder is a preset", "params": ()},
+    {"name": "GetRootGraphHandle", "category": "build", "description": "Get handle to the root graph", "params": ()},
 
     # Conversion
-    {"name": "ConvertFromPreset", "category": "conversion", "description": "Convert preset back to full graph", "params": []},
-    {"name": "ConvertToPreset", "category": "conversion", "description": "Convert graph to preset of reference", "params": ["ReferencedAsset"]},
+    {"name": "ConvertFromPreset", "category": "conversion", "description": "Convert preset back to full graph", "params": ()},
+    {"name": "ConvertToPreset", "category": "conversion", "description": "Convert graph to preset of reference", "params": ("ReferencedAsset",)},
 
     # Query
-    {"name": "FindNodeInputParent", "category": "query", "description": "Find parent node of an input pin", "params": ["InputPin"]},
-    {"name": "FindNodeOutputParent", "category": "query", "description": "Find parent node of an output pin", "params": ["OutputPin"]},
-    {"name": "GetNodeInputData", "category": "query", "description": "Get metadata about an input pin", "params": ["Node", "InputPin"]},
-    {"name": "GetNodeOutputData", "category": "query", "description": "Get metadata about an output pin", "params": ["Node", "OutputPin"]},
-    {"name": "ContainsNode", "category": "query", "description": "Check if graph contains a node", "params": ["NodeHandle"]},
-    {"name": "ContainsNodeInput", "category": "query", "description": "Check if node has named input", "params": ["Node", "InputPin"]},
-    {"name": "ContainsNodeOutput", "category": "query", "description": "Check if node has named output", "params": ["Node", "OutputPin"]},
-    {"name": "GetNodeInputs", "category": "query", "description": "List all inputs on a node", "params": ["NodeHandle"]},
-    {"name": "GetNodeOutputs", "category": "query", "description": "List all outputs on a node", "params": ["NodeHandle"]},
+    {"name": "FindNodeInputParent", "category": "query", "description": "Find parent node of an input pin", "params": ("InputPin",)},
+    {"name": "FindNodeOutputParent", "category": "query", "description": "Find parent node of an output pin", "params": ("OutputPin",)},
+    {"name": "GetNodeInputData", "category": "query", "description": "Get metadata about an input pin", "params": ("Node", "InputPin")},
+    {"name": "GetNodeOutputData", "category": "query", "description": "Get metadata about an output pin", "params": ("Node", "OutputPin")},
+    {"name": "ContainsNode", "category": "query", "description": "Check if graph contains a node", "params": ("NodeHandle",)},
+    {"name": "ContainsNodeInput", "category": "query", "description": "Check if node has named input", "params": ("Node", "InputPin")},
+    {"name": "ContainsNodeOutput", "category": "query", "description": "Check if node has named output", "params": ("Node", "OutputPin")},
+    {"name": "GetNodeInputs", "category": "query", "description": "List all inputs on a node", "params": ("NodeHandle",)},
+    {"name": "GetNodeOutputs", "category": "query", "description": "List all outputs on a node", "params": ("NodeHandle",)},
 
     # UE 5.7: Graph variables
-    {"name": "AddGraphVariable", "category": "variables", "description": "Add a typed variable to the graph", "params": ["Name", "DataType", "DefaultValue"]},
-    {"name": "AddGraphVariableGetNode", "category": "variables", "description": "Add a getter node for a graph variable", "params": ["VariableName"]},
-    {"name": "AddGraphVariableSetNode", "category": "variables", "description": "Add a setter node for a graph variable", "params": ["VariableName"]},
-    {"name": "AddGraphVariableGetDelayedNode", "category": "variables", "description": "Add a delayed getter (reads previous frame value)", "params": ["VariableName"]},
-    {"name": "RemoveGraphVariable", "category": "variables", "description": "Remove a variable from the graph", "params": ["VariableName"]},
-    {"name": "GetGraphVariableDefault", "category": "variables", "description": "Get default value of a graph variable", "params": ["VariableName"]},
+    {"name": "AddGraphVariable", "category": "variables", "description": "Add a typed variable to the graph", "params": ("Name", "DataType", "DefaultValue")},
+    {"name": "AddGraphVariableGetNode", "category": "variables", "description": "Add a getter node for a graph variable", "params": ("VariableName",)},
+    {"name": "AddGraphVariableSetNode", "category": "variables", "description": "Add a setter node for a graph variable", "params": ("VariableName",)},
+    {"name": "AddGraphVariableGetDelayedNode", "category": "variables", "description": "Add a delayed getter (reads previous frame value)", "params": ("VariableName",)},
+    {"name": "RemoveGraphVariable", "category": "variables", "description": "Remove a variable from the graph", "params": ("VariableName",)},
+    {"name": "GetGraphVariableDefault", "category": "variables", "description": "Get default value of a graph variable", "params": ("VariableName",)},
 
     # UE 5.7: Graph pages
-    {"name": "AddGraphPage", "category": "pages", "description": "Add a new page to the graph for organization", "params": ["PageName"]},
-    {"name": "RemoveGraphPage", "category": "pages", "description": "Remove a graph page", "params": ["PageName"]},
-    {"name": "ResetGraphPages", "category": "pages", "description": "Reset all graph pages to default", "params": []},
+    {"name": "AddGraphPage", "category": "pages", "description": "Add a new page to the graph for organization", "params": ("PageName",)},
+    {"name": "RemoveGraphPage", "category": "pages", "description": "Remove a graph page", "params": ("PageName",)},
+    {"name": "ResetGraphPages", "category": "pages", "description": "Reset all graph pages to default", "params": ()},
 
     # UE 5.7: Viewmodel / Preset widget
-    {"name": "InitializeBuilder", "category": "viewmodel", "description": "Initialize MetaSoundEditorViewModel from a builder instance", "params": ["MetaSoundEditorViewModel", "Builder"]},
-    {"name": "InitializeMetaSound", "category": "viewmodel", "description": "Initialize MetaSoundEditorViewModel from a MetaSound asset", "params": ["MetaSoundEditorViewModel", "MetaSoundAsset"]},
-    {"name": "SetLiteralWidgetInputViewmodels", "category": "viewmodel", "description": "Bind a literal widget (knob/slider) to MetaSoundEditorViewModel", "params": ["LiteralWidget", "MetaSoundViewmodel", "WorldContext"]},
-    {"name": "GetSupportedMetaSounds", "category": "viewmodel", "description": "Interface function: specify which MetaSound assets a preset widget supports", "params": ["SupportAllPresets", "ExcludedMetaSounds", "IncludedMetaSounds"]},
+    {"name": "InitializeBuilder", "category": "viewmodel", "description": "Initialize MetaSoundEditorViewModel from a builder instance", "params": ("MetaSoundEditorViewModel", "Builder")},
+    {"name": "InitializeMetaSound", "category": "viewmodel", "description": "Initialize MetaSoundEditorViewModel from a MetaSound asset", "params": ("MetaSoundEditorViewModel", "MetaSoundAsset")},
+    {"name": "SetLiteralWidgetInputViewmodels", "category": "viewmodel", "description": "Bind a literal widget (knob/slider) to MetaSoundEditorViewModel", "params": ("LiteralWidget", "MetaSoundViewmodel", "WorldContext")},
+    {"name": "GetSupportedMetaSounds", "category": "viewmodel", "description": "Interface function: specify which MetaSound assets a preset widget supports", "params": ("SupportAllPresets", "ExcludedMetaSounds", "IncludedMetaSounds")},
 
     # UE 5.7: Transactions (undo/redo observation)
-    {"name": "AddTransactionListener", "category": "transactions", "description": "Register a listener for builder graph transactions (undo/redo)", "params": ["Listener"]},
-    {"name": "RemoveTransactionListener", "category": "transactions", "description": "Unregister a transaction listener", "params": ["Listener"]},
-    {"name": "GetLastTransactionRegistered", "category": "transactions", "description": "Get the most recently registered transaction for undo tracking", "params": []},
+    {"name": "AddTransactionListener", "category": "transactions", "description": "Register a listener for builder graph transactions (undo/redo)", "params": ("Listener",)},
+    {"name": "RemoveTransactionListener", "category": "transactions", "description": "Unregister a transaction listener", "params": ("Listener",)},
+    {"name": "GetLastTransactionRegistered", "category": "transactions", "description": "Get the most recently registered transaction for undo tracking", "params": ()},
 
     # UE 5.7: Live updates
-    {"name": "SetLiveUpdatesEnabled", "category": "live_update", "description": "Enable or disable real-time topology changes while auditioning", "params": ["bEnabled"]},
+    {"name": "SetLiveUpdatesEnabled", "category": "live_update", "description": "Enable or disable real-time topology changes while auditioning", "params": ("bEnabled",)},
 
     # UE 5.7: Expanded connections
-    {"name": "ConnectNodeInputToGraphInput", "category": "connections", "description": "Connect a node input pin directly to a graph-level input", "params": ["Node", "InputPin", "GraphInputName"]},
-    {"name": "ConnectNodeOutputToGraphOutput", "category": "connections", "description": "Connect a node output pin directly to a graph-level output", "params": ["Node", "OutputPin", "GraphOutputName"]},
-    {"name": "DisconnectNodesByInterfaceBindings", "category": "connections", "description": "Disconnect all connections made via interface bindings between two nodes", "params": ["FromNode", "ToNode"]},
+    {"name": "ConnectNodeInputToGraphInput", "category": "connections", "description": "Connect a node input pin directly to a graph-level input", "params": ("Node", "InputPin", "GraphInputName")},
+    {"name": "ConnectNodeOutputToGraphOutput", "category": "connections", "description": "Connect a node output pin directly to a graph-level output", "params": ("Node", "OutputPin", "GraphOutputName")},
+    {"name": "DisconnectNodesByInterfaceBindings", "category": "connections", "description": "Disconnect all connections made via interface bindings between two nodes", "params": ("FromNode", "ToNode")},
 
     # UE 5.7: Expanded metadata
-    {"name": "FindMemberMetadata", "category": "metadata", "description": "Find metadata attached to a graph member (node, input, output)", "params": ["MemberID", "MetadataKey"]},
-    {"name": "SetMemberMetadata", "category": "metadata", "description": "Set metadata on a graph member", "params": ["MemberID", "MetadataKey", "MetadataValue"]},
-    {"name": "ClearMemberMetadata", "category": "metadata", "description": "Remove metadata from a graph member", "params": ["MemberID", "MetadataKey"]},
-    {"name": "FindGraphComment", "category": "metadata", "description": "Find an existing graph comment by ID", "params": ["CommentID"]},
-    {"name": "FindOrAddGraphComment", "category": "metadata", "description": "Find or create a graph comment at a position", "params": ["CommentText", "X", "Y"]},
-    {"name": "RemoveGraphComment", "category": "metadata", "description": "Remove a graph comment by ID", "params": ["CommentID"]},
-    {"name": "SetNodeCommentVisible", "category": "metadata", "description": "Toggle visibility of a node's comment bubble", "params": ["Node", "bVisible"]},
+    {"name": "FindMemberMetadata", "category": "metadata", "description": "Find metadata attached to a graph member (node, input, output)", "params": ("MemberID", "MetadataKey")},
+    {"name": "SetMemberMetadata", "category": "metadata", "description": "Set metadata on a graph member", "params": ("MemberID", "MetadataKey", "MetadataValue")},
+    {"name": "ClearMemberMetadata", "category": "metadata", "description": "Remove metadata from a graph member", "params": ("MemberID", "MetadataKey")},
+    {"name": "FindGraphComment", "category": "metadata", "description": "Find an existing graph comment by ID", "params": ("CommentID",)},
+    {"name": "FindOrAddGraphComment", "category": "metadata", "description": "Find or create a graph comment at a position", "params": ("CommentText", "X", "Y")},
+    {"name": "RemoveGraphComment", "category": "metadata", "description": "Remove a graph comment by ID", "params": ("CommentID",)},
+    {"name": "SetNodeCommentVisible", "category": "metadata", "description": "Toggle visibility of a node's comment bubble", "params": ("Node", "bVisible")},
 
     # UE 5.7: Expanded conversion
-    {"name": "GetReferencedPresetAsset", "category": "conversion", "description": "Get the parent asset that a preset references", "params": []},
+    {"name": "GetReferencedPresetAsset", "category": "conversion", "description": "Get the parent asset that a preset references", "params": ()},
 
     # UE 5.7: Expanded query
-    {"name": "GetGraphInputNames", "category": "query", "description": "List all graph-level input names", "params": []},
-    {"name": "GetGraphOutputNames", "category": "query", "description": "List all graph-level output names", "params": []},
-    {"name": "FindGraphInputNode", "category": "query", "description": "Find the node handle for a named graph input", "params": ["InputName"]},
-    {"name": "FindGraphOutputNode", "category": "query", "description": "Find the node handle for a named graph output", "params": ["OutputName"]},
-]
+    {"name": "GetGraphInputNames", "category": "query", "description": "List all graph-level input names", "params": ()},
+    {"name": "GetGraphOutputNames", "category": "query", "description": "List all graph-level output names", "params": ()},
+    {"name": "FindGraphInputNode", "category": "query", "description": "Find the node handle for a named graph input", "params": ("InputName",)},
+    {"name": "FindGraphOutputNode", "category": "query", "description": "Find the node handle for a named graph output", "params": ("OutputName",)},
+)
 
 
 # ===================================================================
@@ -271,15 +271,15 @@ SPATIALIZATION_METHODS = {
     },
     "Binaural": {
         "description": "Headphone-based 3D audio using HRTF filters",
-        "features": ["HRTF (Head-Related Transfer Function)", "ITD (Interaural Time Difference)", "ILD (Interaural Level Difference)"],
-        "plugins": ["Built-in UE5", "Resonance Audio (Google)", "Steam Audio (Valve)"],
+        "features": ("HRTF (Head-Related Transfer Function)", "ITD (Interaural Time Difference)", "ILD (Interaural Level Difference)"),
+        "plugins": ("Built-in UE5", "Resonance Audio (Google)", "Steam Audio (Valve)"),
         "console_cmd": "au.EnableBinauralAudioForAllSpatialSounds 1",
     },
     "Soundfield": {
         "description": "Ambisonics-based spatial audio encoding",
         "orders": {"First": "4 channels (W, X, Y, Z)", "Note": "UE5 only supports first-order"},
-        "channel_orderings": ["FuMa (Furse-Malham)", "ACN (Ambisonic Channel Number)"],
-        "normalization": ["SN3D", "N3D"],
+        "channel_orderings": ("FuMa (Furse-Malham)", "ACN (Ambisonic Channel Number)"),
+        "normalization": ("SN3D", "N3D"),
     },
 }
 
@@ -291,42 +291,42 @@ SPATIALIZATION_METHODS = {
 ATTENUATION_SUBSYSTEMS = {
     "Volume": {
         "description": "Distance-based volume falloff",
-        "params": ["InnerRadius", "FalloffDistance", "FalloffMode", "dBAttenuationAtMax"],
-        "falloff_modes": ["Linear", "Logarithmic", "Inverse", "LogReverse", "NaturalSound", "Custom"],
+        "params": ("InnerRadius", "FalloffDistance", "FalloffMode", "dBAttenuationAtMax"),
+        "falloff_modes": ("Linear", "Logarithmic", "Inverse", "LogReverse", "NaturalSound", "Custom"),
     },
     "Spatialization": {
         "description": "3D positioning method selection",
-        "params": ["SpatializationMethod", "SpatializationPlugin"],
-        "methods": ["Panning", "Binaural"],
+        "params": ("SpatializationMethod", "SpatializationPlugin"),
+        "methods": ("Panning", "Binaural"),
     },
     "AirAbsorption": {
         "description": "Frequency-dependent distance attenuation (high freqs absorbed more)",
-        "params": ["bEnableAirAbsorption", "AirAbsorptionMethod"],
-        "methods": ["Linear", "CustomCurve"],
+        "params": ("bEnableAirAbsorption", "AirAbsorptionMethod"),
+        "methods": ("Linear", "CustomCurve"),
     },
     "ListenerFocus": {
         "description": "Camera/listener direction-based volume scaling",
-        "params": ["FocusAzimuth", "NonFocusAzimuth", "FocusDistanceScale", "NonFocusDistanceScale",
-                   "FocusPriorityScale", "NonFocusPriorityScale", "FocusVolumeAttenuation", "NonFocusVolumeAttenuation"],
+        "params": ("FocusAzimuth", "NonFocusAzimuth", "FocusDistanceScale", "NonFocusDistanceScale",
+                   "FocusPriorityScale", "NonFocusPriorityScale", "FocusVolumeAttenuation", "NonFocusVolumeAttenuation"),
     },
     "Reverb": {
         "description": "Distance-based reverb send amount",
-        "params": ["bEnableReverbSend", "ReverbSendMethod", "ReverbWetLevelMin", "ReverbWetLevelMax"],
+        "params": ("bEnableReverbSend", "ReverbSendMethod", "ReverbWetLevelMin", "ReverbWetLevelMax"),
     },
     "Occlusion": {
         "description": "Line-of-sight obstruction (walls, objects)",
-        "params": ["bEnableOcclusion", "OcclusionTraceChannel", "OcclusionLowPassFilterFrequency",
-                   "OcclusionVolumeAttenuation", "OcclusionInterpolationTime"],
+        "params": ("bEnableOcclusion", "OcclusionTraceChannel", "OcclusionLowPassFilterFrequency",
+                   "OcclusionVolumeAttenuation", "OcclusionInterpolationTime"),
     },
     "Priority": {
         "description": "Voice priority for channel management",
-        "params": ["bAttenuationPriority", "PriorityAttenuationMin", "PriorityAttenuationMax",
-                   "PriorityAttenuationDistanceMin", "PriorityAttenuationDistanceMax"],
+        "params": ("bAttenuationPriority", "PriorityAttenuationMin", "PriorityAttenuationMax",
+                   "PriorityAttenuationDistanceMin", "PriorityAttenuationDistanceMax"),
     },
     "SubmixSend": {
         "description": "Distance-based submix routing",
-        "params": ["SubmixSendMethod", "SubmixSendDistanceMin", "SubmixSendDistanceMax",
-                   "SubmixSendVolumeMin", "SubmixSendVolumeMax"],
+        "params": ("SubmixSendMethod", "SubmixSendDistanceMin", "SubmixSendDistanceMax",
+                   "SubmixSendVolumeMin", "SubmixSendVolumeMax"),
     },
 }
 
@@ -375,166 +375,166 @@ AUDIO_CONSOLE_COMMANDS = {
 # Tutorial Workflow Catalogue
 # ===================================================================
 
-TUTORIAL_WORKFLOWS = [
+TUTORIAL_WORKFLOWS = (
     {
         "name": "Wind System",
         "tutorial": "MetaSounds Quick Start",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/metasounds-quick-start",
-        "layers": ["blueprint", "metasounds"],
+        "layers": ("blueprint", "metasounds"),
         "blueprint_template": "blueprints/wind_system.json",
         "metasound_template": "metasounds/wind.json",
         "description": "Player speed drives wind noise filter cutoff",
-        "tags": ["procedural", "wind", "environment", "movement"],
+        "tags": ("procedural", "wind", "environment", "movement"),
     },
     {
         "name": "Bomb Fuse",
         "tutorial": "MetaSounds Quick Start",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/metasounds-quick-start",
-        "layers": ["blueprint", "metasounds"],
+        "layers": ("blueprint", "metasounds"),
         "blueprint_template": "blueprints/bomb_fuse.json",
         "metasound_template": "metasounds/gunshot.json",
         "description": "Timer-triggered explosion with fuse countdown",
-        "tags": ["timer", "explosion", "gameplay", "oneshot"],
+        "tags": ("timer", "explosion", "gameplay", "oneshot"),
     },
     {
         "name": "Spectral Analysis",
         "tutorial": "Submixes Overview",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/overview-of-submixes-in-unreal-engine",
-        "layers": ["blueprint"],
+        "layers": ("blueprint",),
         "blueprint_template": "blueprints/spectral_analysis.json",
         "description": "Analyze frequency spectrum from submix for visualizers",
-        "tags": ["analysis", "spectrum", "visualizer", "submix"],
+        "tags": ("analysis", "spectrum", "visualizer", "submix"),
     },
     {
         "name": "Volume Proxy",
         "tutorial": "Volume Proxies Quick Start",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/volume-proxies-quick-start",
-        "layers": ["blueprint"],
+        "layers": ("blueprint",),
         "blueprint_template": "blueprints/volume_proxy.json",
         "description": "Scale audio volume proxy with mouse wheel, condition interface with shift key",
-        "tags": ["volume", "proxy", "interface", "interaction"],
+        "tags": ("volume", "proxy", "interface", "interaction"),
     },
     {
         "name": "Quartz Beat Sync",
         "tutorial": "Quartz Quick Start",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/quartz-quick-start-in-unreal-engine",
-        "layers": ["blueprint"],
+        "layers": ("blueprint",),
         "blueprint_template": "blueprints/quartz_beat_sync.json",
         "description": "Sample-accurate beat-synchronized playback with quantized events",
-        "tags": ["music", "rhythm", "beat", "quartz", "timing"],
+        "tags": ("music", "rhythm", "beat", "quartz", "timing"),
     },
     {
         "name": "Audio Modulation",
         "tutorial": "Audio Modulation Quick Start",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/audio-modulation-quick-start-in-unreal-engine",
-        "layers": ["blueprint"],
+        "layers": ("blueprint",),
         "blueprint_template": "blueprints/audio_modulation.json",
         "description": "Control Bus driven audio modulation from game state",
-        "tags": ["modulation", "control_bus", "dynamic", "mix"],
+        "tags": ("modulation", "control_bus", "dynamic", "mix"),
     },
     {
         "name": "Soundscape Ambient",
         "tutorial": "Soundscape Quick Start",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/soundscape-quick-start",
-        "layers": ["blueprint"],
+        "layers": ("blueprint",),
         "blueprint_template": "blueprints/soundscape_ambient.json",
         "description": "Procedural ambient via GameplayTags and Palette/Color system",
-        "tags": ["ambient", "environment", "soundscape", "procedural"],
+        "tags": ("ambient", "environment", "soundscape", "procedural"),
     },
     {
         "name": "Spatial Attenuation",
         "tutorial": "Sound Attenuation + Spatialization Overview",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/sound-attenuation-in-unreal-engine",
-        "layers": ["blueprint"],
+        "layers": ("blueprint",),
         "blueprint_template": "blueprints/spatial_attenuation.json",
         "description": "3D spatialized sound with distance attenuation, following actor",
-        "tags": ["3d", "spatial", "attenuation", "position"],
+        "tags": ("3d", "spatial", "attenuation", "position"),
     },
     {
         "name": "Submix Recording",
         "tutorial": "Submixes Overview",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/overview-of-submixes-in-unreal-engine",
-        "layers": ["blueprint"],
+        "layers": ("blueprint",),
         "blueprint_template": "blueprints/submix_recording.json",
         "description": "Record submix output to WAV file",
-        "tags": ["recording", "submix", "capture", "wav"],
+        "tags": ("recording", "submix", "capture", "wav"),
     },
     {
         "name": "First Person Footfalls",
         "tutorial": "Creating First Person Footfalls with MetaSounds",
         "url": "https://dev.epicgames.com/community/learning/recommended-community-tutorial/WzJ/creating-first-person-footfalls-with-metasounds",
-        "layers": ["blueprint", "metasounds"],
+        "layers": ("blueprint", "metasounds"),
         "blueprint_template": "blueprints/footfalls_simple.json",
         "metasound_template": "metasounds/footfalls_simple.json",
         "description": "Random footfall samples with timed repeat, graceful stop via custom trigger, Blueprint velocity+ground check with DoOnce gate",
-        "tags": ["footsteps", "movement", "first_person", "random", "trigger_repeat"],
+        "tags": ("footsteps", "movement", "first_person", "random", "trigger_repeat"),
     },
     {
         "name": "Random Audio Playback",
         "tutorial": "Random audio file playback in MetaSound - Ambient Sounds",
         "url": "https://dev.epicgames.com/community/learning/tutorials/random-audio-metasound",
-        "layers": ["metasounds"],
+        "layers": ("metasounds",),
         "metasound_template": "metasounds/random_playback.json",
         "description": "Weighted random WaveAsset selection with timed repetition. OnPlay → Trigger Repeat (Period) → Random Get picks from array using Weights float array for probability control (e.g. [0.1, 0.1, 0.7, 0.1] = 70% index 2). No-repeat guarantee prevents consecutive duplicates. Core building block for ambient, footsteps, and variation-based sounds.",
-        "tags": ["random", "ambient", "weighted", "variation", "trigger_repeat", "building_block"],
+        "tags": ("random", "ambient", "weighted", "variation", "trigger_repeat", "building_block"),
     },
     {
         "name": "Ambient Stingers with Trigger Boxes",
         "tutorial": "Ambient Sounds - Stingers, Transitions & Day/Night Cycles",
         "url": "https://dev.epicgames.com/community/learning/tutorials/ambient-sounds-metasound",
-        "layers": ["blueprint", "metasounds"],
+        "layers": ("blueprint", "metasounds"),
         "blueprint_template": "blueprints/ambient_stingers.json",
         "metasound_template": "metasounds/ambient_stingers.json",
         "description": "Multi-layer ambient with trigger-box crossfades. Base ambient loop + birds/bugs layers faded in via InterpTo (3s). Level Blueprint fires named triggers through Audio Parameter Interface.",
-        "tags": ["ambient", "stingers", "trigger_box", "crossfade", "interp", "layers", "level_blueprint"],
+        "tags": ("ambient", "stingers", "trigger_box", "crossfade", "interp", "layers", "level_blueprint"),
     },
     {
         "name": "MetaSound Preset Widget",
         "tutorial": "Creating MetaSound Preset Widgets (UE 5.7)",
         "url": "https://dev.epicgames.com/documentation/en-us/unreal-engine/creating-metasound-preset-widgets",
-        "layers": ["blueprint"],
+        "layers": ("blueprint",),
         "blueprint_template": "blueprints/metasound_preset_widget.json",
         "description": "Editor Utility Widget with custom knob/slider UI for MetaSound presets. OnPresetWidgetConstructed caches Builder, Construct initializes viewmodel, SetLiteralWidgetInputViewmodels binds float knobs. TechAudioTools plugin (5.7+).",
-        "tags": ["preset", "widget", "ui", "viewmodel", "editor", "knob", "5.7", "TechAudioTools"],
+        "tags": ("preset", "widget", "ui", "viewmodel", "editor", "knob", "5.7", "TechAudioTools"),
     },
     {
         "name": "Sample Player with Loop Controls",
         "tutorial": "Random audio file playback in MetaSound - Ambient Sounds",
         "url": "https://dev.epicgames.com/community/learning/tutorials/random-audio-metasound",
-        "layers": ["metasounds"],
+        "layers": ("metasounds",),
         "metasound_template": "metasounds/sample_player.json",
         "description": "Minimal stereo Wave Player with Loop Start and Loop Duration exposed as slider inputs. Scrub Loop Start to find clean loop points. Duration -1.0 loops whole file. Simplest possible MetaSound Source.",
-        "tags": ["playback", "loop", "sample", "slider", "minimal", "building_block"],
+        "tags": ("playback", "loop", "sample", "slider", "minimal", "building_block"),
     },
     {
         "name": "Subtractive Synthesis",
         "tutorial": "Subtractive synthesis with MetaSounds - Noise + LFO + Filter",
         "url": "https://dev.epicgames.com/community/learning/tutorials/metasound-subtractive-synthesis",
-        "layers": ["metasounds"],
+        "layers": ("metasounds",),
         "metasound_template": "metasounds/subtractive_synth.json",
         "description": "Classic subtractive synthesis: White Noise → Mono Mixer → Biquad Filter (Band Pass). LFO (Sine) sweeps cutoff between 300 Hz and 20 kHz. Frequency input controls LFO rate (0.096 Hz default = slow sweep). Bandwidth controls filter resonance. Produces wind, sci-fi ambience, evolving textures.",
-        "tags": ["synthesis", "subtractive", "noise", "lfo", "filter", "bandpass", "procedural"],
+        "tags": ("synthesis", "subtractive", "noise", "lfo", "filter", "bandpass", "procedural"),
     },
     {
         "name": "SFX Synth Generator",
         "tutorial": "MetaSoundSource SFX Generator (open source UE5.7 plugin)",
         "url": "https://github.com/metasoundsource/sfx-generator",
-        "layers": ["metasounds", "blueprint"],
+        "layers": ("metasounds", "blueprint"),
         "metasound_template": "metasounds/sfx_synth.json",
         "description": "Complete modular SFX synthesizer: 5-oscillator Generator (Pulse/Triangle/Saw/Sine/Noise) → Spectral Effects (WaveShaper/BitCrusher/RingMod) → Crossfade Filter (LP/BP/HP with AD envelope) → Amplifier (Envelope + AM LFO) → Temporal Effects (Delay/Plate Reverb/4x Flanger send bus). Normalized 0-1 inputs mapped via Linear To Log Frequency. Multistage pitch jumps for laser/sci-fi. Wave Writer for recording output. Preset system: one Source, many parameter snapshots = many sounds. Blueprint Editor Widget with knobs, randomize, lock, record toggle.",
-        "tags": ["synthesis", "sfx", "generator", "procedural", "preset", "modular", "oscillator", "filter", "effects", "waveshaper", "bitcrusher", "reverb", "flanger", "delay"],
+        "tags": ("synthesis", "sfx", "generator", "procedural", "preset", "modular", "oscillator", "filter", "effects", "waveshaper", "bitcrusher", "reverb", "flanger", "delay"),
     },
     {
         "name": "Mono Synth (Minimoog-style)",
         "tutorial": "Minimoog-style mono synthesizer with MetaSounds",
         "url": "https://dev.epicgames.com/community/learning/tutorials/metasound-mono-synth",
-        "layers": ["blueprint", "metasounds"],
+        "layers": ("blueprint", "metasounds"),
         "blueprint_template": "blueprints/set_float_parameter.json",
         "metasound_template": "metasounds/mono_synth.json",
         "description": "Minimoog-inspired mono synth: Saw + Pink Noise + Square → Mono Mixer (4) → Biquad Filter (Low Pass). Looping AD Envelope sweeps filter cutoff via Map Range (base Cutoff → Filter env amount). MSP_Sequencer steps MIDI notes with Glide portamento. MSP_ADControl splits Period by attack/decay ratio. Blueprint uses Event Tick → Set Float Parameter for real-time knob updates.",
-        "tags": ["synthesis", "mono", "minimoog", "sequencer", "envelope", "filter", "oscillator", "procedural"],
+        "tags": ("synthesis", "mono", "minimoog", "sequencer", "envelope", "filter", "oscillator", "procedural"),
     },
-]
+)
 
 
 # ===================================================================
@@ -545,7 +545,7 @@ TUTORIAL_WORKFLOWS = [
 # Sound Cues are legacy but still work in UE5. MetaSounds replaces them
 # for procedural audio. Blueprint patterns transfer directly.
 
-UE4_TO_UE5_CONVERSION: list[dict] = [
+UE4_TO_UE5_CONVERSION: tuple[dict, ...] = (
     # --- Sound Cue Nodes → MetaSounds Equivalents ---
     {
         "ue4_node": "Random",
@@ -674,4 +674,4 @@ UE4_TO_UE5_CONVERSION: list[dict] = [
         "ue5_notes": "MetaSounds replaces Sound Cues for all procedural audio. Sound Cues still work for simple playback but cannot do DSP synthesis, filters, or real-time parameter modulation.",
         "example_from": "All 48 Sound Cues from Ambient Procedural Sound project",
     },
-]
+)
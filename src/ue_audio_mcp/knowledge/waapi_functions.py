@@ -34,6 +34,7 @@ def _func(
     return {
         "uri": uri,
         "namespace": namespace,
+        "operation": uri.rpartition(".")[2],
         "description": description,
         "params": params or [],
         "returns": returns,
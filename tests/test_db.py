@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import json
+import sqlite3
+
+import pytest
 
 from ue_audio_mcp.knowledge.db import KnowledgeDB
 
+# Minimal node for tests that only need one row in metasound_nodes
+_SINE_NODE = {
+    "name": "Sine", "category": "Generators", "description": "Sine",
+    "inputs": [], "outputs": [], "tags": [], "complexity": 1,
+}
 
 def test_insert_and_query_node():
     db = KnowledgeDB(":memory:")
@@ -118,6 +126,100 @@ def test_is_seeded():
     db.close()
 
 
+def _pragma(db: KnowledgeDB, name: str, arg: str | None = None) -> list[tuple]:
+    """Rows of a PRAGMA on the DB's own connection (settings are per-connection)."""
+    sql = f"PRAGMA {name}" if arg is None else f"PRAGMA {name}({arg})"
+    return [tuple(row) for row in db._conn.execute(sql)]
+
+
+def test_transaction_commits_once_and_rolls_back(tmp_path):
+    path = str(tmp_path / "kb.db")
+    db = KnowledgeDB(path)
+    reader = sqlite3.connect(path)
+
+    def committed() -> int:
+        return reader.execute("SELECT COUNT(*) FROM metasound_nodes").fetchone()[0]
+
+    with db.transaction():
+        db.insert_node(_SINE_NODE)
+        assert committed() == 0  # per-row commit deferred
+    assert committed() == 1
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert_node({**_SINE_NODE, "name": "Saw"})
+            raise RuntimeError("boom")
+    assert db.query_nodes(name="Saw") == []
+    assert committed() == 1
+    reader.close()
+    db.close()
+
+
+def test_bulk_load_restores_pragmas(tmp_path):
+    db = KnowledgeDB(str(tmp_path / "kb.db"))
+    sync = _pragma(db, "synchronous")
+    with db.bulk_load():
+        assert _pragma(db, "synchronous") == [(0,)]  # OFF
+        db.insert_node(_SINE_NODE)
+    assert _pragma(db, "synchronous") == sync
+    assert db.is_seeded() is True
+    db.close()
+
+
+def test_bulk_load_defers_and_rebuilds_indexes():
+    db = KnowledgeDB(":memory:")
+
+    def indexes(table: str) -> set[str]:
+        # index_list rows: (seq, name, unique, origin, partial); "c" = CREATE INDEX
+        return {row[1] for row in _pragma(db, "index_list", table) if row[3] == "c"}
+
+    before = indexes("metasound_nodes")
+    assert before
+    aliases = indexes("node_aliases")
+    assert len(aliases) == 1
+    with db.bulk_load(defer_indexes=["metasound_nodes", "node_aliases"]):
+        assert indexes("metasound_nodes") == set()
+        assert indexes("node_aliases") == set()
+        assert indexes("graph_node_usage")  # not being loaded
+    assert indexes("metasound_nodes") == before
+    assert indexes("node_aliases") == aliases
+
+    with pytest.raises(RuntimeError):
+        with db.bulk_load(defer_indexes=["metasound_nodes"]):
+            raise RuntimeError("boom")
+    assert indexes("metasound_nodes") == before  # rolled back with the transaction
+
+    db.insert_node(_SINE_NODE)
+    with db.bulk_load(defer_indexes=["metasound_nodes"]):
+        assert indexes("metasound_nodes") == before  # populated: kept
+    db.close()
+
+
+def test_file_db_uses_wal(tmp_path):
+    path = str(tmp_path / "kb.db")
+    db = KnowledgeDB(path)
+    assert _pragma(db, "synchronous") == [(1,)]  # NORMAL
+    # journal_mode=WAL is persistent, so a fresh connection sees it too
+    reader = sqlite3.connect(path)
+    assert reader.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    reader.close()
+    db.close()
+
+
+def test_insert_nodes_batch_matches_single_insert():
+    db = KnowledgeDB(":memory:")
+    db.insert_node({**_SINE_NODE, "tags": ["osc"]})
+    n = db.insert_nodes_batch([
+        ("Saw", "Generators", "Saw", "[]", "[]", '["osc"]', 1,
+         "", "", "catalogue", ""),
+    ])
+    assert n == 1
+    single, batch = db.query_nodes(name="Sine")[0], db.query_nodes(name="Saw")[0]
+    assert set(single) == set(batch)
+    assert batch["tags"] == ["osc"]
+    db.close()
+
+
 def test_seed_database():
     from ue_audio_mcp.knowledge.seed import seed_database
     db = KnowledgeDB(":memory:")
@@ -132,6 +234,62 @@ def test_seed_database():
     db.close()
 
 
+def test_reseed_is_idempotent():
+    from ue_audio_mcp.knowledge.seed import seed_database
+    db = KnowledgeDB(":memory:")
+    seed_database(db)
+    first = db.table_counts()
+    seed_database(db)
+    assert db.table_counts() == first
+    db.close()
+
+
+def test_seed_database_only_subset():
+    from ue_audio_mcp.knowledge.seed import seed_database
+    db = KnowledgeDB(":memory:")
+    counts = seed_database(db, only={"wwise_types", "waapi_functions"})
+    assert set(counts) == {"wwise_types", "waapi_functions"}
+    assert db.is_seeded() is False  # metasound_nodes untouched
+    with pytest.raises(ValueError):
+        seed_database(db, only={"no_such_table"})
+    db.close()
+
+
+def test_seed_infers_variant_group_for_late_nodes(monkeypatch):
+    from ue_audio_mcp.knowledge.metasound_nodes import METASOUND_NODES
+    from ue_audio_mcp.knowledge.seed import seed_database
+    # Nodes synced in at runtime carry no variant_group / source
+    monkeypatch.setitem(METASOUND_NODES, "Late Filter (Audio)", {
+        "name": "Late Filter (Audio)", "category": "Filters",
+        "description": "Added at runtime", "inputs": [], "outputs": [],
+        "tags": [],
+    })
+    db = KnowledgeDB(":memory:")
+    seed_database(db, only={"metasound_nodes"})
+    node = db.query_nodes(name="Late Filter (Audio)")[0]
+    assert node["variant_group"] == "Late Filter"
+    assert node["source"] == "catalogue"
+    db.close()
+
+
+def test_short_aliases_only_for_unambiguous_names(knowledge_db):
+    assert knowledge_db.resolve_node_alias("Array Concat") == "Array Concat (WaveAsset)"
+    # "Clamp" has several variants, so no short alias points at any one of them
+    assert knowledge_db.resolve_node_alias("Clamp") is None
+
+
+def test_reseed_drops_stale_short_aliases():
+    from ue_audio_mcp.knowledge.seed import seed_database
+    db = KnowledgeDB(":memory:")
+    seed_database(db, only={"node_aliases"})
+    # An older seeder emitted ambiguous short aliases; re-seeding must clear them
+    db.insert_node_aliases_batch([("Clamp", "Clamp (Float)", "short")])
+    seed_database(db, only={"node_aliases"})
+    assert db.resolve_node_alias("Clamp") is None
+    assert db.resolve_node_alias("Array Concat") == "Array Concat (WaveAsset)"
+    db.close()
+
+
 def test_wwise_type_descriptions_not_generic():
     from ue_audio_mcp.knowledge.seed import seed_database
     db = KnowledgeDB(":memory:")
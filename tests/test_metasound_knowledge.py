@@ -124,3 +124,14 @@ def test_builder_api_new_categories(knowledge_db):
     assert "pages" in categories
     assert "transactions" in categories
     assert "live_update" in categories
+
+
+def test_infer_variant_group():
+    """Variant group strips the variant-specific qualifier from a node name."""
+    from ue_audio_mcp.knowledge.metasound_nodes import _infer_variant_group
+    assert _infer_variant_group("Audio Mixer (Stereo, 3)") == "Audio Mixer (Stereo)"
+    assert _infer_variant_group("Trigger Any (4)") == "Trigger Any"
+    assert _infer_variant_group("Clamp (Float)") == "Clamp"
+    assert _infer_variant_group("Sine") == ""
+    # Multi-paren names take the regex path
+    assert _infer_variant_group("Map (Range) (Float)") == "Map (Range)"